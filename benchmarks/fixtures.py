@@ -0,0 +1,162 @@
+"""Deterministic stand-in data for the offline benchmarks.
+
+Payloads mirror the shape of real Typeform responses, Proxycurl profiles
+and startup landing pages. A directory of recorded payloads can be used
+instead (see ``load_recordings``).
+"""
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Subset of the Typeform field refs mapped in TypeFormConnector
+FIELD_REFS = {
+    "founder_name": ("aea1a8b5-3439-418c-b873-5602a2b6107e", "text"),
+    "founder_title": ("48820fb6-e43c-4e5c-8f9c-d74428f9a679", "text"),
+    "founder_email": ("1c0f2be0-a322-4da4-8007-5dd5fb6d48d6", "email"),
+    "founder_phone": ("39d91d37-55d8-4817-9454-84d663b31ae8", "phone_number"),
+    "linkedin_url": ("fb9e9315-f726-4642-aa37-448f5a7f5d7f", "url"),
+    "company_name": ("3ad66bfa-4df3-4067-9f7c-0b5037459579", "text"),
+    "website": ("2abac0ae-4a29-4276-8f72-7a045fac3f01", "url"),
+    "description": ("ed20ab50-f510-4b63-bbde-8b08b7e856e8", "text"),
+    "funding_stage": ("2bd5e597-a398-4302-9af5-8d4ba1d3fe8c", "text"),
+    "active_users": ("6a107f69-c163-442e-a085-50e115b9904c", "text"),
+    "mrr": ("10b68790-547f-4e9a-9fd2-4988bbef853e", "text"),
+    "round_size": ("e355201f-7fda-4218-bbba-0b6ac2b8295f", "text"),
+}
+
+TECH_WORDS = ['react', 'python', 'django', 'aws', 'kubernetes', 'docker', 'pytorch', 'blockchain']
+FILLER = (
+    "We help teams ship faster by automating the boring parts of their workflow. "
+    "Our platform integrates with the tools you already use and scales with you. "
+)
+
+
+def typeform_response(i: int, site_base: str, linkedin_base: str) -> Dict:
+    """One completed Typeform response"""
+    values = {
+        "founder_name": f"Founder {i}",
+        "founder_title": "CEO",
+        "founder_email": f"founder{i}@startup{i}.example",
+        "founder_phone": f"+1555{i:07d}",
+        "linkedin_url": f"{linkedin_base}/in/founder-{i}",
+        "company_name": f"Startup {i}",
+        "website": f"{site_base}/sites/startup-{i}/",
+        "description": FILLER,
+        "funding_stage": "Seed",
+        "active_users": f"{(i * 37) % 50000:,}",
+        "mrr": f"${(i * 113) % 90000:,}",
+        "round_size": "1,500,000",
+    }
+    answers = []
+    for field, (ref, kind) in FIELD_REFS.items():
+        answers.append({"field": {"ref": ref}, "type": kind, kind: values[field]})
+    return {"response_id": f"resp-{i:06d}", "answers": answers}
+
+
+def proxycurl_profile(i: int) -> Dict:
+    """One Proxycurl person profile"""
+    rng = random.Random(i)
+    return {
+        "full_name": f"Founder {i}",
+        "headline": "Building the future of work",
+        "summary": FILLER * 3,
+        "country": "US",
+        "city": "Tampa",
+        "connections_count": rng.randint(50, 500),
+        "skills": rng.sample(TECH_WORDS, 4),
+        "experiences": [
+            {
+                "company": f"Company {i}-{n}",
+                "title": "Engineer",
+                "description": FILLER * 2,
+                "starts_at": {"year": 2010 + n},
+            }
+            for n in range(rng.randint(3, 8))
+        ],
+        "education": [{"school": "University of South Florida", "degree_name": "BSc"}],
+        "accomplishments": {"projects": [{"title": f"Project {n}"} for n in range(3)]},
+    }
+
+
+def startup_html(i: int, paragraphs: int = 40) -> str:
+    """A landing page with team, contact, social and meta sections"""
+    rng = random.Random(i)
+    techs = ' '.join(rng.sample(TECH_WORDS, 3))
+    body = ''.join(f"<p>{FILLER} {techs}</p>" for _ in range(paragraphs))
+    team = ''.join(
+        f'<div class="team-member"><h3>Person {n}</h3>'
+        f'<span class="role">Engineer</span></div>'
+        for n in range(6)
+    )
+    return (
+        "<html><head>"
+        f"<title>Startup {i}</title>"
+        f'<meta name="description" content="Startup {i} landing page">'
+        f'<meta property="og:title" content="Startup {i}">'
+        '<script src="/static/react.production.min.js"></script>'
+        "</head><body>"
+        f'<main class="main-content">{body}</main>'
+        f'<section class="team">{team}</section>'
+        f'<div class="address">{i} Main St, Tampa, FL</div>'
+        f"<footer>hello@startup{i}.example +1 (555) 010-{i % 10000:04d}"
+        '<a href="https://www.linkedin.com/company/x">LinkedIn</a>'
+        '<a href="https://twitter.com/x">Twitter</a>'
+        '<a href="https://github.com/x">GitHub</a>'
+        "</footer></body></html>"
+    )
+
+
+class Corpus:
+    """Payloads served by the stand-in servers"""
+
+    def __init__(self,
+                 responses: List[Dict],
+                 profiles: Dict[str, Dict],
+                 sites: Dict[str, str]):
+        self.responses = responses
+        self.profiles = profiles
+        self.sites = sites
+
+    @classmethod
+    def synthetic(cls, size: int, base_url: str) -> 'Corpus':
+        """Generate ``size`` linked submissions, profiles and sites"""
+        responses = [typeform_response(i, base_url, base_url) for i in range(size)]
+        profiles = {f"{base_url}/in/founder-{i}": proxycurl_profile(i) for i in range(size)}
+        sites = {f"startup-{i}": startup_html(i) for i in range(size)}
+        return cls(responses, profiles, sites)
+
+    @classmethod
+    def load_recordings(cls, directory: Path, base_url: str) -> 'Corpus':
+        """Load recorded payloads from a directory
+
+        Expected layout: ``typeform_responses.json`` (list of response
+        items), ``proxycurl/<slug>.json`` and ``sites/<slug>.html``.
+        Recorded URLs are rewritten to point at the stand-in servers.
+        """
+        directory = Path(directory)
+        responses = json.loads((directory / "typeform_responses.json").read_text())
+        profiles = {
+            f"{base_url}/in/{path.stem}": json.loads(path.read_text())
+            for path in sorted((directory / "proxycurl").glob("*.json"))
+        }
+        sites = {path.stem: path.read_text() for path in sorted((directory / "sites").glob("*.html"))}
+
+        profile_slugs = [url.rsplit('/', 1)[-1] for url in profiles]
+        site_slugs = list(sites)
+        website_ref = FIELD_REFS["website"][0]
+        linkedin_ref = FIELD_REFS["linkedin_url"][0]
+        for n, response in enumerate(responses):
+            for answer in response.get("answers", []):
+                ref = answer.get("field", {}).get("ref")
+                if ref == website_ref and site_slugs:
+                    answer["url"] = f"{base_url}/sites/{site_slugs[n % len(site_slugs)]}/"
+                elif ref == linkedin_ref and profile_slugs:
+                    answer["url"] = f"{base_url}/in/{profile_slugs[n % len(profile_slugs)]}"
+        return cls(responses, profiles, sites)
+
+
+def build_corpus(size: int, base_url: str, recordings: Optional[Path] = None) -> Corpus:
+    if recordings:
+        return Corpus.load_recordings(recordings, base_url)
+    return Corpus.synthetic(size, base_url)
@@ -0,0 +1,268 @@
+"""Offline benchmark suite for the ingestion pipeline.
+
+Runs the pipeline against local stand-in servers and a throwaway SQLite
+database, then compares timings against a stored baseline:
+
+    python benchmarks/run_benchmarks.py --save-baseline   # record baseline
+    python benchmarks/run_benchmarks.py                   # compare, exit 1 on regression
+
+The baseline records the run parameters (corpus size, injected latency and
+errors, recordings); a run with different ones exits 2 without comparing.
+"""
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from benchmarks.fixtures import build_corpus
+from benchmarks.stub_servers import StubServer
+from scripts.import_typeform_data import import_typeform_data
+from src.data_ingestion.linkedin_fetcher import LinkedInFetcher
+from src.data_ingestion.typeform_connector import TypeFormConnector
+from src.data_ingestion.website_crawler import WebsiteCrawler
+from src.database.db_manager import DatabaseManager
+from src.models.scoring import StartupScore
+from src.models.website_data import WebsiteData
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def _timed(func: Callable[[], None], repeat: int) -> float:
+    """Median wall time of ``repeat`` runs"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _sqlite_manager(tmp_dir: Path, name: str) -> DatabaseManager:
+    db_path = tmp_dir / f"{name}.db"
+    if db_path.exists():
+        db_path.unlink()
+    db_manager = DatabaseManager(f"sqlite:///{db_path}")
+    db_manager.init_db()
+    return db_manager
+
+
+def _check_import(db_manager: DatabaseManager, submissions: int, complete: bool):
+    """Fail the benchmark if the import dropped rows
+
+    import_typeform_data logs and skips failed submissions, so a broken
+    import would otherwise just look faster. With injected errors only the
+    startups are required; enrichment may still be waiting on retries.
+    """
+    stats = db_manager.get_table_stats()
+    tables = ["startups", "linkedin_profiles", "website_data"] if complete else ["startups"]
+    missing = {table: stats[table] for table in tables if stats[table] != submissions}
+    if missing:
+        raise RuntimeError(f"Import stored {missing} rows, expected {submissions} per table")
+
+
+def bench_import_e2e(stub: StubServer, tmp_dir: Path, repeat: int) -> Dict[str, float]:
+    """Full import: Typeform fetch, Proxycurl fetch, crawl and DB writes"""
+    submissions = min(len(stub.corpus.responses), 100)
+    run = [0]
+
+    def run_import():
+        run[0] += 1
+        db_path = tmp_dir / f"import_{run[0]}.db"
+        config = {
+            "database": {"connection_string": f"sqlite:///{db_path}"},
+            "typeform": {"api_key": "bench", "form_id": "bench", "base_url": stub.typeform_url},
+            "proxycurl": {"api_key": "bench", "base_url": stub.proxycurl_url},
+            # All stand-in sites share one host; skip the politeness delay
+            "crawler": {"crawl_delay_seconds": 0},
+        }
+        db_manager = DatabaseManager.from_config(config["database"])
+        db_manager.init_db()
+        import_typeform_data(config)
+        _check_import(db_manager, submissions, complete=stub.error_rate == 0)
+
+    seconds = _timed(run_import, repeat)
+    return {"seconds": seconds, "submissions_per_second": submissions / seconds}
+
+
+def bench_crawl(stub: StubServer, repeat: int) -> Dict[str, float]:
+    """Fetch and extract every site in the corpus"""
+    crawler = WebsiteCrawler()
+    urls = [f"{stub.base_url}/sites/{slug}/" for slug in stub.corpus.sites]
+
+    def crawl():
+        for n, url in enumerate(urls):
+            crawler.process_website(url, n)
+
+    seconds = _timed(crawl, repeat)
+    return {"seconds": seconds, "pages_per_second": len(urls) / seconds}
+
+
+def bench_extraction(stub: StubServer, repeat: int) -> Dict[str, float]:
+    """HTML parsing and extraction only, no network"""
+    crawler = WebsiteCrawler()
+    pages = list(stub.corpus.sites.values())
+
+    def extract():
+        for n, html in enumerate(pages):
+            crawler.parse_website(html, "http://bench.local/", n)
+
+    seconds = _timed(extract, repeat)
+    return {"seconds": seconds, "ms_per_page": seconds / len(pages) * 1000}
+
+
+def bench_scoring(repeat: int, count: int = 5000) -> Dict[str, float]:
+    """StartupScore.calculate_scores over random metrics"""
+    rng = random.Random(0)
+    inputs = [
+        tuple({f"m{k}": rng.random() for k in range(5)} for _ in range(3))
+        for _ in range(count)
+    ]
+
+    def score():
+        for team, market, financial in inputs:
+            StartupScore.calculate_scores(team, market, financial)
+
+    seconds = _timed(score, repeat)
+    return {"seconds": seconds, "us_per_score": seconds / count * 1e6}
+
+
+def bench_db_writes(stub: StubServer, tmp_dir: Path, repeat: int) -> Dict[str, float]:
+    """Insert startups with LinkedIn profiles and website data"""
+    typeform = TypeFormConnector("bench")
+    fetcher = LinkedInFetcher("bench")
+    crawler = WebsiteCrawler()
+    corpus = stub.corpus
+    profiles = list(corpus.profiles.values())
+    pages = list(corpus.sites.values())
+    # Extraction happens once up front so only the writes are timed
+    website_fields = [
+        {c.name: getattr(data, c.name) for c in data.__table__.columns if c.name not in ('id', 'startup_id')}
+        for data in (crawler.parse_website(html, "http://bench.local/", 0) for html in pages)
+    ]
+    run = [0]
+
+    def write():
+        run[0] += 1
+        db_manager = _sqlite_manager(tmp_dir, f"writes_{run[0]}")
+        with db_manager.session_scope() as session:
+            for n, response in enumerate(corpus.responses):
+                startup = typeform.process_startup_data(response)
+                session.add(startup)
+                session.flush()
+                session.add(fetcher.process_profile_data(profiles[n % len(profiles)], startup.id))
+                session.add(WebsiteData(startup_id=startup.id, **website_fields[n % len(website_fields)]))
+
+    seconds = _timed(write, repeat)
+    rows = len(corpus.responses) * 3
+    return {"seconds": seconds, "rows_per_second": rows / seconds}
+
+
+def run_benchmarks(size: int,
+                   repeat: int,
+                   latency_ms: float,
+                   error_rate: float,
+                   recordings: Optional[Path] = None) -> Dict[str, Dict[str, float]]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, \
+            StubServer(latency_ms=latency_ms, error_rate=error_rate) as stub:
+        tmp_dir = Path(tmp)
+        stub.corpus = build_corpus(size, stub.base_url, recordings)
+        results["import_e2e"] = bench_import_e2e(stub, tmp_dir, repeat)
+        results["crawl"] = bench_crawl(stub, repeat)
+        results["extraction"] = bench_extraction(stub, repeat)
+        results["scoring"] = bench_scoring(repeat)
+        results["db_writes"] = bench_db_writes(stub, tmp_dir, repeat)
+    return results
+
+
+def mismatched_params(params: Dict, baseline: Dict) -> Dict[str, tuple]:
+    """Run parameters that differ from the baseline's, as (baseline, current)"""
+    recorded = baseline.get("params", {})
+    return {
+        name: (recorded.get(name), value)
+        for name, value in params.items()
+        if recorded.get(name) != value
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> bool:
+    """Print a comparison table; return False if any benchmark regressed"""
+    ok = True
+    print(f"{'benchmark':<14}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in results.items():
+        current = result["seconds"]
+        base = baseline["results"].get(name, {}).get("seconds")
+        if base is None:
+            print(f"{name:<14}{'-':>12}{current:>11.3f}s{'new':>10}")
+            continue
+        change = current / base - 1
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{name:<14}{base:>11.3f}s{current:>11.3f}s{change:>+9.1%}{flag}")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=50, help="submissions/profiles/sites in the corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (median is reported)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added to every stub response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub responses that fail with 503")
+    parser.add_argument("--recordings", type=Path, help="directory of recorded payloads to replay")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--output", type=Path, help="also write results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="keep pipeline INFO logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    # Timings are only comparable between runs with the same workload
+    params = {
+        "size": args.size,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "recordings": str(args.recordings) if args.recordings else None,
+    }
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() and not args.save_baseline else None
+    if baseline is not None:
+        mismatched = mismatched_params(params, baseline)
+        if mismatched:
+            for name, (recorded, current) in mismatched.items():
+                print(f"{name}: baseline {recorded!r}, current {current!r}")
+            print(f"Run parameters differ from {args.baseline}; "
+                  "re-run with the baseline's parameters or record a new one with --save-baseline")
+            return 2
+
+    results = run_benchmarks(args.size, args.repeat, args.latency_ms, args.error_rate, args.recordings)
+    if args.output:
+        args.output.write_text(json.dumps({"params": params, "results": results}, indent=2))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"params": params, "results": results}, indent=2))
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(json.dumps(results, indent=2))
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    return 0 if compare(results, baseline, args.tolerance) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Local HTTP stand-ins for Typeform, Proxycurl and startup websites"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.fixtures import Corpus
+
+
+class StubServer:
+    """Serves a Corpus on 127.0.0.1 with optional latency and error injection
+
+    Injected errors apply to Proxycurl and the sites only: the import makes
+    a single Typeform request and does not retry it, so failing it would
+    abort the run rather than exercise the retry paths.
+
+    Routes:
+        GET /forms/<form_id>/responses   Typeform responses API
+        GET /proxycurl/api/v2/linkedin   Proxycurl person profile (?url=)
+        GET /sites/<slug>/               Startup landing page
+    """
+
+    def __init__(self,
+                 latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0,
+                 error_rate: float = 0.0,
+                 seed: int = 0):
+        self.corpus: Optional[Corpus] = None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.requests_served = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def typeform_url(self) -> str:
+        return f"{self.base_url}/forms"
+
+    @property
+    def proxycurl_url(self) -> str:
+        return f"{self.base_url}/proxycurl/api/v2"
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _inject(self, can_fail: bool = True) -> bool:
+        """Sleep for the configured latency; return True to fail this request"""
+        with self._rng_lock:
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.error_rate and can_fail
+            self.requests_served += 1
+        if delay:
+            time.sleep(delay / 1000)
+        return fail
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_json(self, payload, status: int = 200):
+                self._send(status, json.dumps(payload).encode(), 'application/json')
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                parts = [p for p in parsed.path.split('/') if p]
+                query = parse_qs(parsed.query)
+                corpus = stub.corpus
+                responses = len(parts) == 3 and parts[0] == 'forms' and parts[2] == 'responses'
+
+                if stub._inject(can_fail=not responses):
+                    self._send_json({'error': 'injected failure'}, status=503)
+                    return
+
+                if responses:
+                    page_size = int(query.get('page_size', ['25'])[0])
+                    items = corpus.responses[:page_size]
+                    self._send_json({'total_items': len(corpus.responses), 'page_count': 1, 'items': items})
+                elif parsed.path.rstrip('/') == '/proxycurl/api/v2/linkedin':
+                    profile = corpus.profiles.get(query.get('url', [''])[0])
+                    if profile is None:
+                        self._send_json({'code': 404, 'description': 'Person not found'}, status=404)
+                    else:
+                        self._send_json(profile)
+                elif len(parts) == 2 and parts[0] == 'sites' and parts[1] in corpus.sites:
+                    self._send(200, corpus.sites[parts[1]].encode(), 'text/html; charset=utf-8')
+                else:
+                    self._send(404, b'Not Found', 'text/plain')
+
+        return Handler
@@ -19,7 +19,7 @@ def init_database():
     
     try:
         # Initialize database manager
-        db_manager = DatabaseManager(config["database"]["connection_string"])
+        db_manager = DatabaseManager.from_config(config["database"])
         
         # Create all tables
         db_manager.init_db()
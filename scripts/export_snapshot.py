@@ -0,0 +1,40 @@
+import os
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import argparse
+import yaml
+from src.database.db_manager import DatabaseManager
+from src.database.snapshot_export import SnapshotExporter
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+def export_snapshot():
+    """Export the deal-flow tables as columnar files for analytics"""
+    parser = argparse.ArgumentParser(description="Export a columnar snapshot of the database")
+    parser.add_argument("output_dir", help="directory for partition files and _manifest.json")
+    parser.add_argument("--format", choices=["arrow", "parquet", "npz"],
+                        help="default: arrow when pyarrow is installed, otherwise npz")
+    parser.add_argument("--tables", nargs="+", default=["startups", "linkedin_profiles", "website_data"])
+    parser.add_argument("--full", action="store_true", help="re-export everything instead of changed rows")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+    
+    config_path = project_root / "config" / "config.yaml"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    
+    try:
+        db_manager = DatabaseManager.from_config(config["database"])
+        exporter = SnapshotExporter(db_manager, args.output_dir, fmt=args.format, chunk_size=args.chunk_size)
+        written = exporter.export(args.tables, incremental=not args.full)
+        logger.info(f"Snapshot written to {args.output_dir}: {written}")
+    except Exception as e:
+        logger.error(f"Snapshot export failed: {str(e)}")
+        raise
+
+if __name__ == "__main__":
+    export_snapshot()
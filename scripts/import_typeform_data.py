@@ -5,76 +5,98 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 import yaml
+from typing import Dict, Optional
 from src.database.db_manager import DatabaseManager
 from src.data_ingestion.typeform_connector import TypeFormConnector
-from src.utils.logger import setup_logger
+from src.utils.logger import setup_logger, log_context
+from src.utils.metrics import metrics, configure_metrics, finish_metrics
+from src.utils.profiling import profile_stage, add_profile_arguments, profiler_from_args
 from src.models.startup import Startup
 from src.data_ingestion.linkedin_fetcher import LinkedInFetcher
 from src.data_ingestion.website_crawler import WebsiteCrawler
+from src.data_ingestion.enrichment_jobs import make_enrichment_handlers, store_submission
+from src.data_ingestion.crawl_scheduler import CrawlScheduler
+from src.database.job_queue import JobQueue, JobWorker
 
 logger = setup_logger(__name__)
 
-def import_typeform_data():
-    """Import data from Typeform and store in database"""
+def _base_url(section: Dict) -> Dict:
+    """Optional API base URL override (used to point at local stand-ins)"""
+    return {"base_url": section["base_url"]} if section.get("base_url") else {}
+
+def import_typeform_data(config: Optional[Dict] = None, run_jobs: bool = True):
+    """Import data from Typeform and store in database
+    
+    With ``run_jobs=False`` submissions are only stored and their enrichment
+    left to separate workers (scripts/run_enrichment_worker.py and
+    scripts/run_crawler.py).
+    """
     try:
         # Load config
-        config_path = project_root / "config" / "config.yaml"
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        if config is None:
+            config_path = project_root / "config" / "config.yaml"
+            with open(config_path) as f:
+                config = yaml.safe_load(f)
+        configure_metrics(config.get("metrics"))
         
         # Initialize connectors
-        db_manager = DatabaseManager(config["database"]["connection_string"])
-        typeform = TypeFormConnector(config["typeform"]["api_key"])
-        linkedin_fetcher = LinkedInFetcher(config["proxycurl"]["api_key"])
+        db_manager = DatabaseManager.from_config(config["database"])
+        typeform = TypeFormConnector(config["typeform"]["api_key"], **_base_url(config["typeform"]))
+        linkedin_fetcher = LinkedInFetcher(config["proxycurl"]["api_key"], **_base_url(config["proxycurl"]))
         website_crawler = WebsiteCrawler()
         
         # Fetch responses
-        responses = typeform.fetch_responses(config["typeform"]["form_id"])
+        with profile_stage("typeform_fetch"):
+            responses = typeform.fetch_responses(config["typeform"]["form_id"])
         logger.info(f"Fetched {len(responses)} responses from Typeform")
         
-        # Process and store each response
-        with db_manager.session_scope() as session:
-            for response in responses:
+        # Store each submission and queue its enrichment. Every submission
+        # commits on its own and already stored submissions are skipped, so
+        # an interrupted import resumes where it stopped.
+        job_queue = JobQueue(db_manager)
+        for response in responses:
+            with log_context(submission_id=response["response_id"]):
                 try:
-                    # Process startup data
-                    startup = typeform.process_startup_data(response)
-                    session.add(startup)
-                    session.flush()  # Get startup ID
-                    
-                    # Fetch and process LinkedIn data if URL exists
-                    if startup.linkedin_url:
-                        linkedin_data = linkedin_fetcher.fetch_profile(startup.linkedin_url)
-                        if linkedin_data:
-                            profile = linkedin_fetcher.process_profile_data(
-                                linkedin_data, 
-                                startup.id
-                            )
-                            session.add(profile)
-                            logger.info(f"Added LinkedIn profile for {startup.founder_name}")
+                    with profile_stage("store_submission"), db_manager.session_scope() as session:
+                        with metrics.timer("stage_seconds", stage="typeform_process"):
+                            startup = store_submission(session, typeform, job_queue, response)
+                    if startup is None:
+                        continue
                     
-                    # Crawl website if URL exists
-                    if startup.website:
-                        website_data = website_crawler.process_website(
-                            startup.website, 
-                            startup.id
-                        )
-                        if website_data:
-                            session.add(website_data)
-                            logger.info(f"Added website data for {startup.company_name}")
-                    
-                    session.commit()
+                    metrics.increment("submissions_imported_total")
                     logger.info(f"Added submission {response['response_id']}")
                     
                 except Exception as e:
+                    metrics.increment("submissions_failed_total")
                     logger.error(f"Error processing data: {str(e)}")
-                    session.rollback()
                     continue
         
+        # Run queued enrichment jobs, including retries left from earlier runs,
+        # then crawl the websites that are due in the frontier
+        if run_jobs:
+            worker = JobWorker(job_queue, make_enrichment_handlers(db_manager, linkedin_fetcher))
+            with profile_stage("enrichment_jobs"):
+                processed = worker.run(stop_when_idle=True)
+            logger.info(f"Ran {processed} enrichment jobs, queue status: {job_queue.counts()}")
+            
+            scheduler = CrawlScheduler.from_config(db_manager, website_crawler, config.get("crawler"))
+            with profile_stage("crawl"):
+                crawled = scheduler.run(stop_when_idle=True)
+            logger.info(f"Crawled {crawled} websites")
+        
         logger.info("Import completed successfully")
+        finish_metrics(config.get("metrics"), logger)
         
     except Exception as e:
         logger.error(f"Import failed: {str(e)}")
         raise
 
 if __name__ == "__main__":
-    import_typeform_data() 
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Import Typeform submissions")
+    parser.add_argument("--enqueue-only", action="store_true",
+                        help="store submissions and queue enrichment without running it")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    with profiler_from_args(args, logger):
+        import_typeform_data(run_jobs=not args.enqueue_only) 
\ No newline at end of file
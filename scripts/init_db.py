@@ -22,7 +22,7 @@ def init_database():
             config = yaml.safe_load(f)
         
         # Initialize database manager
-        db_manager = DatabaseManager(config["database"]["connection_string"])
+        db_manager = DatabaseManager.from_config(config["database"])
         
         # Drop existing tables and create new ones
         db_manager.drop_db()
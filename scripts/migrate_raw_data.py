@@ -0,0 +1,110 @@
+import os
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import argparse
+import json
+import yaml
+from sqlalchemy import LargeBinary, bindparam, inspect, text
+from src.database.db_manager import DatabaseManager
+from src.database.types import CompressedJSON
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Columns of the old schema whose data now lives only in raw_data
+LEGACY_COLUMNS = ('experiences', 'education', 'accomplishments')
+
+def migrate_raw_data(db_manager: DatabaseManager, batch_size: int = 500) -> int:
+    """Bring an existing linkedin_profiles table to the compressed layout
+
+    - On PostgreSQL ``raw_data`` becomes bytea (values become uncompressed
+      JSON bytes, which CompressedJSON still reads), ``skills`` becomes
+      jsonb and its GIN index is created.
+    - Every row that is not compressed yet is rewritten; values only found
+      in the old experiences/education/accomplishments columns are merged
+      into raw_data first, then those columns are dropped.
+
+    Safe to re-run; returns the number of rows rewritten.
+    """
+    engine = db_manager.engine
+    postgres = engine.dialect.name == 'postgresql'
+    columns = {c['name']: c['type'].__class__.__name__ for c in inspect(engine).get_columns('linkedin_profiles')}
+    legacy = [name for name in LEGACY_COLUMNS if name in columns]
+
+    if postgres and columns['raw_data'] in ('JSON', 'JSONB'):
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE linkedin_profiles ALTER COLUMN raw_data "
+                "TYPE bytea USING convert_to(raw_data::text, 'UTF8')"
+            ))
+        logger.info("Changed linkedin_profiles.raw_data to bytea")
+
+    rewritten = _rewrite_rows(engine, legacy, batch_size)
+
+    with engine.begin() as conn:
+        for name in legacy:
+            conn.execute(text(f"ALTER TABLE linkedin_profiles DROP COLUMN {name}"))
+            logger.info(f"Dropped linkedin_profiles.{name}")
+        if postgres:
+            if columns.get('skills') == 'JSON':
+                conn.execute(text(
+                    "ALTER TABLE linkedin_profiles ALTER COLUMN skills TYPE jsonb USING skills::jsonb"
+                ))
+                logger.info("Changed linkedin_profiles.skills to jsonb")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_linkedin_profiles_skills "
+                "ON linkedin_profiles USING gin (skills jsonb_path_ops)"
+            ))
+    return rewritten
+
+def _rewrite_rows(engine, legacy, batch_size: int) -> int:
+    """Compress raw_data, folding in values from the legacy columns"""
+    codec = CompressedJSON()
+    select_batch = text(
+        f"SELECT {', '.join(['id', 'raw_data', *legacy])} FROM linkedin_profiles "
+        "WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_row = text(
+        "UPDATE linkedin_profiles SET raw_data = :raw_data WHERE id = :id"
+    ).bindparams(bindparam('raw_data', type_=LargeBinary))
+
+    rewritten = 0
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(select_batch, {'last_id': last_id, 'limit': batch_size}).all()
+            if not rows:
+                return rewritten
+            for row_id, value, *legacy_values in rows:
+                data = codec.process_result_value(value, engine.dialect) if value is not None else None
+                merged = False
+                for name, legacy_value in zip(legacy, legacy_values):
+                    if legacy_value is not None and name not in (data or {}):
+                        data = data or {}
+                        data[name] = json.loads(legacy_value) if isinstance(legacy_value, str) else legacy_value
+                        merged = True
+                if data is not None and (merged or not _is_compressed(value)):
+                    conn.execute(update_row, {'id': row_id, 'raw_data': codec.process_bind_param(data, engine.dialect)})
+                    rewritten += 1
+            last_id = rows[-1][0]
+        logger.info(f"Rewrote {rewritten} raw_data values so far")
+
+def _is_compressed(value) -> bool:
+    # zlib streams start with 0x78; JSON text starts with '{', '[' or '"'
+    return isinstance(value, (bytes, memoryview)) and bytes(value[:1]) == b'\x78'
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate linkedin_profiles to compressed raw_data")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    config_path = project_root / "config" / "config.yaml"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+
+    db_manager = DatabaseManager.from_config(config["database"])
+    rewritten = migrate_raw_data(db_manager, batch_size=args.batch_size)
+    logger.info(f"Compressed raw_data for {rewritten} LinkedIn profiles")
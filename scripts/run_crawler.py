@@ -0,0 +1,46 @@
+import os
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import argparse
+import json
+import yaml
+from typing import Optional
+from src.database.db_manager import DatabaseManager
+from src.data_ingestion.crawl_scheduler import CrawlScheduler
+from src.data_ingestion.website_crawler import WebsiteCrawler
+from src.utils.logger import setup_logger
+from src.utils.profiling import add_profile_arguments, profiler_from_args
+
+logger = setup_logger(__name__)
+
+def run_crawler(forever: bool = False, scores_path: Optional[str] = None) -> int:
+    """Crawl websites from the crawl frontier in priority order
+
+    ``scores_path`` is a JSON object of startup id -> score (0-1); stale
+    websites of high-score startups are then re-crawled first.
+    """
+    config_path = project_root / "config" / "config.yaml"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    
+    db_manager = DatabaseManager.from_config(config["database"])
+    scheduler = CrawlScheduler.from_config(db_manager, WebsiteCrawler(), config.get("crawler"))
+    if scores_path:
+        with open(scores_path) as f:
+            scores = {int(startup_id): float(score) for startup_id, score in json.load(f).items()}
+        logger.info(f"Rescored {scheduler.rescore(scores)} frontier entries")
+    crawled = scheduler.run(stop_when_idle=not forever)
+    logger.info(f"Crawled {crawled} websites")
+    return crawled
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl due websites from the crawl frontier")
+    parser.add_argument("--forever", action="store_true", help="keep polling for due websites")
+    parser.add_argument("--scores", metavar="FILE", help="JSON of startup id -> score (0-1) used to order re-crawls")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    with profiler_from_args(args, logger):
+        run_crawler(forever=args.forever, scores_path=args.scores)
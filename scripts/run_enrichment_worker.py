@@ -0,0 +1,68 @@
+import os
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import argparse
+import multiprocessing
+import yaml
+from typing import Dict
+from src.database.db_manager import DatabaseManager
+from src.database.job_queue import JobQueue, JobWorker
+from src.data_ingestion.enrichment_jobs import make_enrichment_handlers
+from src.data_ingestion.linkedin_fetcher import LinkedInFetcher
+from src.utils.logger import setup_logger, shutdown_logging
+
+logger = setup_logger(__name__)
+
+def run_worker(config: Dict, forever: bool = False) -> int:
+    """Process enrichment jobs from the database queue"""
+    db_manager = DatabaseManager.from_config(config["database"])
+    proxycurl = config["proxycurl"]
+    linkedin_fetcher = LinkedInFetcher(
+        proxycurl["api_key"],
+        **({"base_url": proxycurl["base_url"]} if proxycurl.get("base_url") else {})
+    )
+    worker = JobWorker(JobQueue(db_manager), make_enrichment_handlers(db_manager, linkedin_fetcher))
+    processed = worker.run(stop_when_idle=not forever)
+    logger.info(f"Worker {worker.worker_id} processed {processed} jobs")
+    return processed
+
+def _worker_process(config: Dict, forever: bool):
+    # multiprocessing children skip atexit, so flush queued records here
+    try:
+        run_worker(config, forever)
+    finally:
+        shutdown_logging()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run enrichment job workers")
+    parser.add_argument("--processes", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--forever", action="store_true", help="keep polling instead of exiting when idle")
+    parser.add_argument("--requeue-dead", action="store_true", help="retry dead-lettered jobs before starting")
+    args = parser.parse_args()
+    
+    config_path = project_root / "config" / "config.yaml"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    
+    if args.requeue_dead:
+        requeued = JobQueue(DatabaseManager.from_config(config["database"])).requeue_dead()
+        logger.info(f"Requeued {requeued} dead jobs")
+    
+    if args.processes == 1:
+        run_worker(config, args.forever)
+        return
+    
+    workers = [
+        multiprocessing.Process(target=_worker_process, args=(config, args.forever))
+        for _ in range(args.processes)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import asyncio
+import threading
+import yaml
+from src.database.db_manager import DatabaseManager
+from src.database.job_queue import JobQueue, JobWorker
+from src.data_ingestion.enrichment_jobs import make_enrichment_handlers
+from src.data_ingestion.crawl_scheduler import CrawlScheduler
+from src.data_ingestion.linkedin_fetcher import LinkedInFetcher
+from src.data_ingestion.typeform_connector import TypeFormConnector
+from src.data_ingestion.typeform_webhook import TypeformWebhookServer
+from src.data_ingestion.website_crawler import WebsiteCrawler
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+def run_webhook_server():
+    """Receive Typeform webhooks and enrich new submissions as they arrive"""
+    config_path = project_root / "config" / "config.yaml"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    webhook_config = config.get("webhook") or {}
+    
+    db_manager = DatabaseManager.from_config(config["database"])
+    server = TypeformWebhookServer(
+        db_manager,
+        TypeFormConnector(config["typeform"]["api_key"]),
+        secret=config["typeform"]["webhook_secret"],
+        path=webhook_config.get("path", "/webhooks/typeform"),
+        batch_window=webhook_config.get("batch_window_ms", 500) / 1000,
+        max_batch=webhook_config.get("max_batch", 50),
+    )
+    
+    # Enrichment workers poll the job queue the webhook writes to
+    proxycurl = config["proxycurl"]
+    handlers = make_enrichment_handlers(db_manager, LinkedInFetcher(
+        proxycurl["api_key"],
+        **({"base_url": proxycurl["base_url"]} if proxycurl.get("base_url") else {})
+    ))
+    for n in range(webhook_config.get("workers", 2)):
+        worker = JobWorker(JobQueue(db_manager), handlers, poll_interval=webhook_config.get("poll_interval", 1.0))
+        worker.worker_id = f"{worker.worker_id}:{n}"
+        threading.Thread(target=worker.run, daemon=True).start()
+    
+    # New websites enter the crawl frontier with top priority
+    scheduler = CrawlScheduler.from_config(db_manager, WebsiteCrawler(), config.get("crawler"))
+    threading.Thread(
+        target=scheduler.run,
+        kwargs={"poll_interval": webhook_config.get("poll_interval", 1.0)},
+        daemon=True,
+    ).start()
+    
+    asyncio.run(server.serve_forever(
+        webhook_config.get("host", "0.0.0.0"),
+        webhook_config.get("port", 8080),
+    ))
+
+if __name__ == "__main__":
+    run_webhook_server()
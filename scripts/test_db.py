@@ -21,17 +21,29 @@ def test_database():
             config = yaml.safe_load(f)
         
         # Initialize database manager
-        db_manager = DatabaseManager(config["database"]["connection_string"])
+        db_manager = DatabaseManager.from_config(config["database"])
         
         # Test connection
         if db_manager.check_connection():
             logger.info("Successfully connected to database")
             
-            # Get table statistics
-            stats = db_manager.get_table_stats()
-            logger.info("Table statistics:")
+            # Get table statistics (planner estimates, no table scans)
+            stats = db_manager.get_table_stats(approximate=True)
+            logger.info("Table statistics (approximate):")
             for table, count in stats.items():
-                logger.info(f"{table}: {count} rows")
+                logger.info(f"{table}: ~{count} rows")
+            
+            # Storage breakdown per table
+            logger.info("Storage usage (bytes):")
+            for table, sizes in db_manager.get_storage_stats().items():
+                logger.info(
+                    f"{table}: table={sizes['table_bytes']} toast={sizes['toast_bytes']} "
+                    f"indexes={sizes['index_bytes']} total={sizes['total_bytes']}"
+                )
+            
+            # Connection pool usage
+            for engine_name, pool_status in db_manager.get_pool_status().items():
+                logger.info(f"Pool ({engine_name}): {pool_status}")
         else:
             logger.error("Failed to connect to database")
             
@@ -0,0 +1,395 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, urlunparse
+from sqlalchemy import extract, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+from src.data_ingestion.website_crawler import WebsiteCrawler
+from src.database.db_manager import DatabaseManager
+from src.models.crawl_frontier import CrawlFrontierEntry, CrawlDomain
+from src.models.website_data import WebsiteData
+from src.utils.logger import log_context
+from src.utils.metrics import metrics
+from src.utils.profiling import profile_stage
+import logging
+import time
+import uuid
+
+# Priorities: brand new submissions first, then re-crawls. At pick time
+# re-crawls are ordered by startup score and by how long they are overdue.
+PRIORITY_NEW = 100.0
+PRIORITY_RECRAWL = 10.0
+SCORE_WEIGHT = 10.0       # a score of 1.0 is worth this much priority
+STALENESS_PER_DAY = 1.0   # priority gained per day past next_due_at
+
+# WebsiteData columns copied when one crawl is shared by several startups
+_WEBSITE_FIELDS = [
+    c.name for c in WebsiteData.__table__.columns
+    if c.name not in ('id', 'startup_id', 'created_at', 'updated_at')
+]
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form used to de-duplicate frontier entries
+
+    Scheme variants, a leading ``www.`` and default ports map to one entry:
+    ``acme.com``, ``http://acme.com/``, ``https://www.acme.com`` and
+    ``https://ACME.com:443/`` all become ``https://acme.com/``. A URL with
+    a non-default port keeps its scheme, since the port decides the
+    protocol.
+    """
+    url = url.strip()
+    if '://' not in url:
+        url = f"https://{url}"
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    host = parsed.hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port is None or port == DEFAULT_PORTS.get(scheme):
+        scheme, netloc = 'https', host
+    else:
+        netloc = f"{host}:{port}"
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((scheme, netloc, path, '', parsed.query, ''))
+
+
+def url_domain(url: str) -> str:
+    """Registrable host used for politeness and backoff"""
+    host = urlparse(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+@dataclass
+class ClaimedEntry:
+    """Snapshot of a frontier entry leased to a scheduler"""
+    id: int
+    url: str
+    domain: str
+    claim_token: str
+
+
+class LeaseLost(Exception):
+    """The entry's lease expired and it was claimed by another scheduler"""
+
+
+class CrawlScheduler:
+    """Feeds the website crawler from the persisted crawl frontier.
+
+    Due entries are crawled in priority order, with at most one URL per
+    domain in each batch so a domain with many startups cannot starve the
+    others. Each domain has a politeness delay between fetches and an
+    exponential backoff after errors. A URL listed by several startups is
+    fetched once and the result stored for each of them.
+
+    Several schedulers (the webhook server, scripts/run_crawler.py, the
+    import) can run at once: a batch is leased the way JobQueue.claim
+    leases jobs, and a domain with a leased entry is skipped by the others.
+    """
+
+    def __init__(self,
+                 db_manager: DatabaseManager,
+                 crawler: Optional[WebsiteCrawler] = None,
+                 recrawl_interval: timedelta = timedelta(days=7),
+                 crawl_delay: timedelta = timedelta(seconds=2),
+                 backoff_base: timedelta = timedelta(minutes=5),
+                 backoff_max: timedelta = timedelta(days=1),
+                 batch_size: int = 20,
+                 lease_seconds: int = 600):
+        self.db_manager = db_manager
+        self.crawler = crawler or WebsiteCrawler()
+        self.recrawl_interval = recrawl_interval
+        self.crawl_delay = crawl_delay
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_config(cls,
+                    db_manager: DatabaseManager,
+                    crawler: Optional[WebsiteCrawler] = None,
+                    crawler_config: Optional[Dict] = None) -> 'CrawlScheduler':
+        """Create a scheduler from the ``crawler`` section of config.yaml"""
+        crawler_config = crawler_config or {}
+        return cls(
+            db_manager,
+            crawler,
+            recrawl_interval=timedelta(days=crawler_config.get('recrawl_interval_days', 7)),
+            crawl_delay=timedelta(seconds=crawler_config.get('crawl_delay_seconds', 2)),
+            backoff_base=timedelta(seconds=crawler_config.get('backoff_base_seconds', 300)),
+            batch_size=crawler_config.get('batch_size', 20),
+            lease_seconds=crawler_config.get('lease_seconds', 600),
+        )
+
+    @staticmethod
+    def add(session: Session, url: str, startup_id: int, priority: float = PRIORITY_NEW) -> CrawlFrontierEntry:
+        """Schedule ``url`` for ``startup_id`` in the caller's transaction
+
+        A URL that is already in the frontier gains the startup and is made
+        due immediately, so the new startup gets its website data.
+        """
+        normalized = normalize_url(url)
+        entry = session.execute(
+            select(CrawlFrontierEntry).where(CrawlFrontierEntry.url == normalized)
+        ).scalar_one_or_none()
+        if entry is None:
+            entry = CrawlFrontierEntry(
+                url=normalized,
+                domain=url_domain(normalized),
+                startup_ids=[startup_id],
+                priority=priority,
+                score=0.0,
+                next_due_at=datetime.utcnow(),
+            )
+            session.add(entry)
+            return entry
+
+        if startup_id not in (entry.startup_ids or []):
+            entry.startup_ids = (entry.startup_ids or []) + [startup_id]
+            entry.priority = max(entry.priority, priority)
+            entry.next_due_at = min(entry.next_due_at, datetime.utcnow())
+        return entry
+
+    def rescore(self, scores: Dict[int, float]) -> int:
+        """Record startup scores (0-1) on their entries; returns entries updated
+
+        Each entry keeps the best score of its startups until the next
+        rescore, so high-score startups are re-crawled first when stale.
+        """
+        updated = 0
+        with self.db_manager.session_scope() as session:
+            for entry in session.scalars(select(CrawlFrontierEntry)):
+                entry.score = max((scores.get(startup_id, 0.0) for startup_id in entry.startup_ids or []), default=0.0)
+                updated += 1
+        return updated
+
+    def _days_overdue(self, now: datetime):
+        if self.db_manager.engine.dialect.name == 'postgresql':
+            return extract('epoch', now - CrawlFrontierEntry.next_due_at) / 86400
+        return func.julianday(now) - func.julianday(CrawlFrontierEntry.next_due_at)
+
+    def _candidates(self, now: datetime, limit: int):
+        """Ids of the best due, unleased entry per domain, best first"""
+        effective = (
+            CrawlFrontierEntry.priority
+            + CrawlFrontierEntry.score * SCORE_WEIGHT
+            + self._days_overdue(now) * STALENESS_PER_DAY
+        )
+        leased = aliased(CrawlFrontierEntry)
+        ranked = (
+            select(
+                CrawlFrontierEntry.id,
+                CrawlFrontierEntry.next_due_at,
+                effective.label('effective'),
+                func.row_number().over(
+                    partition_by=CrawlFrontierEntry.domain,
+                    order_by=(effective.desc(), CrawlFrontierEntry.next_due_at),
+                ).label('domain_rank'),
+            )
+            .outerjoin(CrawlDomain, CrawlDomain.domain == CrawlFrontierEntry.domain)
+            .where(
+                CrawlFrontierEntry.next_due_at <= now,
+                or_(CrawlDomain.next_allowed_at.is_(None), CrawlDomain.next_allowed_at <= now),
+                or_(CrawlFrontierEntry.lease_expires_at.is_(None), CrawlFrontierEntry.lease_expires_at < now),
+                # Another scheduler is fetching from this domain right now
+                CrawlFrontierEntry.domain.not_in(
+                    select(leased.domain).where(leased.lease_expires_at >= now)
+                ),
+            )
+            .subquery()
+        )
+        return (
+            select(ranked.c.id)
+            .where(ranked.c.domain_rank == 1)
+            .order_by(ranked.c.effective.desc(), ranked.c.next_due_at)
+            .limit(limit)
+        )
+
+    def claim(self, limit: Optional[int] = None) -> List[ClaimedEntry]:
+        """Lease the next batch: due entries in priority order, one per domain"""
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        candidates = self._candidates(now, limit or self.batch_size)
+        available = or_(CrawlFrontierEntry.lease_expires_at.is_(None), CrawlFrontierEntry.lease_expires_at < now)
+
+        with self.db_manager.session_scope() as session:
+            ids = session.scalars(candidates).all()
+            if session.bind.dialect.name == 'postgresql':
+                # FOR UPDATE cannot be combined with the window function,
+                # so the chosen rows are locked in a second step
+                ids = session.scalars(
+                    select(CrawlFrontierEntry.id)
+                    .where(CrawlFrontierEntry.id.in_(ids), available)
+                    .with_for_update(skip_locked=True)
+                ).all()
+            if not ids:
+                return []
+            # Re-check availability in the update so an entry picked by two
+            # schedulers at once is leased by only one of them
+            session.execute(
+                update(CrawlFrontierEntry)
+                .where(CrawlFrontierEntry.id.in_(ids), available)
+                .values(claim_token=token, lease_expires_at=now + timedelta(seconds=self.lease_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            rows = session.execute(
+                select(CrawlFrontierEntry.id, CrawlFrontierEntry.url, CrawlFrontierEntry.domain)
+                .where(CrawlFrontierEntry.claim_token == token)
+            ).all()
+        rank = {entry_id: n for n, entry_id in enumerate(ids)}
+        return sorted((ClaimedEntry(*row, claim_token=token) for row in rows), key=lambda entry: rank[entry.id])
+
+    def crawl_entry(self, claimed: ClaimedEntry) -> bool:
+        """Fetch one leased URL and store the result for its startups
+
+        The fetch runs outside any transaction; the result, the domain's
+        politeness state and the release of the lease commit together.
+        """
+        with log_context(url=claimed.url, stage='crawl'):
+            try:
+                with profile_stage('crawl.fetch'):
+                    html_content = self.crawler.fetch_website(claimed.url)
+                # parse_website marks its own crawl.parse / crawl.extract.* stages
+                website_data = self.crawler.parse_website(html_content, claimed.url, None) if html_content else None
+            except Exception as e:
+                self.logger.error(f"Crawling {claimed.url} failed: {str(e)}")
+                website_data = None
+
+            # Includes the flush and commit at the end of the session scope
+            with profile_stage('crawl.db_store'), self.db_manager.session_scope() as session:
+                return self._record(session, claimed, website_data)
+
+    def _record(self, session: Session, claimed: ClaimedEntry, website_data: Optional[WebsiteData]) -> bool:
+        now = datetime.utcnow()
+        entry = session.get(CrawlFrontierEntry, claimed.id, with_for_update=True)
+        if entry is None or entry.claim_token != claimed.claim_token:
+            raise LeaseLost(f"Lease lost for {claimed.url}")
+        entry.claim_token = None
+        entry.lease_expires_at = None
+        domain = self._domain(session, claimed.domain)
+        domain.last_fetch_at = now
+
+        if website_data is None:
+            entry.error_count += 1
+            entry.last_error = 'fetch or parse failed'
+            domain.consecutive_errors += 1
+            backoff = min(self.backoff_base * 2 ** (domain.consecutive_errors - 1), self.backoff_max)
+            domain.next_allowed_at = now + backoff
+            entry.next_due_at = now + min(self.backoff_base * 2 ** (entry.error_count - 1), self.backoff_max)
+            metrics.increment('crawl_failures_total', domain=claimed.domain)
+            return False
+
+        domain.consecutive_errors = 0
+        domain.next_allowed_at = now + self.crawl_delay
+        entry.error_count = 0
+        entry.last_error = None
+        entry.last_crawled_at = now
+        entry.next_due_at = now + self.recrawl_interval
+        entry.priority = PRIORITY_RECRAWL
+        for startup_id in entry.startup_ids or []:
+            self._store(session, startup_id, website_data)
+        metrics.increment('crawl_pages_total')
+        return True
+
+    @staticmethod
+    def _domain(session: Session, name: str) -> CrawlDomain:
+        """The domain's politeness row, created without racing other schedulers"""
+        dialect = session.bind.dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            session.execute(
+                insert(CrawlDomain)
+                .values(domain=name, consecutive_errors=0)
+                .on_conflict_do_nothing(index_elements=['domain'])
+            )
+            return session.get(CrawlDomain, name, with_for_update=True)
+        domain = session.get(CrawlDomain, name)
+        if domain is None:
+            domain = CrawlDomain(domain=name, consecutive_errors=0)
+            session.add(domain)
+        return domain
+
+    @staticmethod
+    def _store(session: Session, startup_id: int, website_data: WebsiteData):
+        """Insert or refresh the startup's website data"""
+        existing = session.execute(
+            select(WebsiteData).where(WebsiteData.startup_id == startup_id)
+        ).scalars().first()
+        if existing is None:
+            existing = WebsiteData(startup_id=startup_id)
+            session.add(existing)
+        for field in _WEBSITE_FIELDS:
+            setattr(existing, field, getattr(website_data, field))
+
+    def run_once(self) -> int:
+        """Crawl one leased batch; returns the number of URLs attempted
+
+        Errors are logged per URL; an entry whose result could not be
+        stored is retried once its lease expires.
+        """
+        batch = self.claim()
+        for claimed in batch:
+            try:
+                with metrics.timer('crawl_entry_seconds'):
+                    self.crawl_entry(claimed)
+            except LeaseLost as e:
+                self.logger.warning(str(e))
+            except Exception as e:
+                self.logger.error(f"Storing crawl of {claimed.url} failed: {str(e)}")
+        return len(batch)
+
+    def _politeness_wait(self) -> Optional[float]:
+        """Seconds until a domain with due entries leaves its politeness delay
+
+        Returns None when no due entry is waiting on a short delay (only on
+        error backoff, or nothing is due at all).
+        """
+        now = datetime.utcnow()
+        with self.db_manager.session_scope(read_only=True) as session:
+            next_allowed = session.execute(
+                select(func.min(CrawlDomain.next_allowed_at))
+                .join(CrawlFrontierEntry, CrawlFrontierEntry.domain == CrawlDomain.domain)
+                .where(CrawlFrontierEntry.next_due_at <= now, CrawlDomain.next_allowed_at > now)
+            ).scalar()
+        if next_allowed is None or next_allowed - now > self.crawl_delay:
+            return None
+        return (next_allowed - now).total_seconds()
+
+    def run(self, stop_when_idle: bool = False, poll_interval: float = 5.0) -> int:
+        """Crawl due entries until none are left (or forever); returns URLs attempted
+
+        Running forever, database errors are logged and the scheduler keeps
+        polling instead of exiting.
+        """
+        attempted = 0
+        while True:
+            try:
+                crawled = self.run_once()
+                wait = None if crawled else self._politeness_wait()
+            except Exception as e:
+                if stop_when_idle:
+                    raise
+                self.logger.error(f"Crawl scheduling failed, retrying: {str(e)}")
+                time.sleep(poll_interval)
+                continue
+            attempted += crawled
+            if crawled:
+                continue
+            if wait is not None:
+                time.sleep(wait)
+            elif stop_when_idle:
+                return attempted
+            else:
+                time.sleep(poll_interval)
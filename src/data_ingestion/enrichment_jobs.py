@@ -0,0 +1,83 @@
+from typing import Dict, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.data_ingestion.linkedin_fetcher import LinkedInFetcher
+from src.data_ingestion.typeform_connector import TypeFormConnector
+from src.data_ingestion.crawl_scheduler import CrawlScheduler
+from src.database.db_manager import DatabaseManager
+from src.database.job_queue import ClaimedJob, JobHandler, JobQueue, JobStore, ENRICH_LINKEDIN
+from src.models.linkedin_profile import LinkedInProfile
+from src.models.startup import Startup
+from src.utils.logger import log_context
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def store_submission(session: Session,
+                     typeform: TypeFormConnector,
+                     job_queue: JobQueue,
+                     response: Dict) -> Optional[Startup]:
+    """Store a Typeform response, queue its LinkedIn enrichment and add its
+    website to the crawl frontier
+
+    Returns None if the submission is already stored.
+    """
+    exists = session.execute(
+        select(Startup.id).where(Startup.submission_id == response["response_id"])
+    ).first()
+    if exists:
+        return None
+    
+    startup = typeform.process_startup_data(response)
+    session.add(startup)
+    session.flush()  # Get startup ID
+    
+    if startup.linkedin_url:
+        job_queue.enqueue(session, ENRICH_LINKEDIN, startup.id)
+    if startup.website:
+        CrawlScheduler.add(session, startup.website, startup.id)
+    return startup
+
+
+def make_enrichment_handlers(db_manager: DatabaseManager,
+                             linkedin_fetcher: LinkedInFetcher) -> Dict[str, JobHandler]:
+    """Job handlers for the enrichment steps of the Typeform import
+
+    Website crawling is not a job; it is scheduled through the crawl
+    frontier (see CrawlScheduler).
+
+    Handlers raise on failure so the job queue retries them, and skip
+    startups that already have the data so a re-run job is harmless.
+    API calls happen before the job's transaction is opened, so no
+    connection is held while waiting on the network.
+    """
+
+    def enrich_linkedin(job: ClaimedJob) -> Optional[JobStore]:
+        with db_manager.session_scope() as session:
+            startup = session.get(Startup, job.startup_id)
+            if startup is None or not startup.linkedin_url:
+                return None
+            exists = session.execute(
+                select(LinkedInProfile.id).where(LinkedInProfile.startup_id == startup.id)
+            ).first()
+            if exists:
+                return None
+            linkedin_url = startup.linkedin_url
+            submission_id = startup.submission_id
+            founder_name = startup.founder_name
+
+        with log_context(submission_id=submission_id, stage='linkedin'):
+            linkedin_data = linkedin_fetcher.fetch_profile(linkedin_url)
+        if not linkedin_data:
+            raise RuntimeError(f"No LinkedIn data for {linkedin_url}")
+
+        def store(session: Session):
+            session.add(linkedin_fetcher.process_profile_data(linkedin_data, job.startup_id))
+            with log_context(submission_id=submission_id, stage='linkedin'):
+                logger.info(f"Added LinkedIn profile for {founder_name}")
+        return store
+
+    return {
+        ENRICH_LINKEDIN: enrich_linkedin,
+    }
@@ -1,12 +1,15 @@
 import requests
 from typing import Dict, Optional
 import logging
+from urllib.parse import urlparse
 from src.models.linkedin_profile import LinkedInProfile
+from src.utils.metrics import metrics
 
 class LinkedInFetcher:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = "https://nubela.co/proxycurl/api/v2"):
         self.api_key = api_key
-        self.base_url = "https://nubela.co/proxycurl/api/v2"
+        self.base_url = base_url
+        self.host = urlparse(base_url).netloc
         self.logger = logging.getLogger(__name__)
     
     def fetch_profile(self, linkedin_url: str) -> Optional[Dict]:
@@ -22,10 +25,14 @@ class LinkedInFetcher:
         }
         
         try:
-            response = requests.get(endpoint, headers=headers, params=params)
+            with metrics.timer('fetch_seconds', host=self.host):
+                response = requests.get(endpoint, headers=headers, params=params, timeout=30)
+            metrics.increment('http_responses_total', host=self.host, status=response.status_code)
+            metrics.increment('bytes_downloaded_total', len(response.content), host=self.host)
             response.raise_for_status()
             return response.json()
         except Exception as e:
+            metrics.increment('fetch_errors_total', host=self.host)
             self.logger.error(f"Error fetching LinkedIn profile for {linkedin_url}: {str(e)}")
             return None
     
@@ -43,18 +50,10 @@ class LinkedInFetcher:
         profile.country = raw_data.get('country')
         profile.city = raw_data.get('city')
         
-        # Extract experiences
-        profile.experiences = raw_data.get('experiences', [])
-        
-        # Extract education
-        profile.education = raw_data.get('education', [])
-        
-        # Extract skills
+        # Experiences, education and accomplishments are read from raw_data
+        # on demand, so only the small, queryable skills list is copied out
         profile.skills = raw_data.get('skills', [])
         
-        # Extract accomplishments
-        profile.accomplishments = raw_data.get('accomplishments', [])
-        
         # Extract network info
         profile.connections_count = raw_data.get('connections_count')
         
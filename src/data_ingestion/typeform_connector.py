@@ -2,15 +2,18 @@ from typing import Dict, List, Union
 import requests
 from src.models.startup import Startup
 from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
 import re
+from urllib.parse import urlparse
 import logging
 
 logger = setup_logger(__name__)
 
 class TypeFormConnector:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = "https://api.typeform.com/forms"):
         self.api_key = api_key
-        self.base_url = "https://api.typeform.com/forms"
+        self.base_url = base_url
+        self.host = urlparse(base_url).netloc
         self.headers = {
             "Authorization": f"Bearer {self.api_key}"
         }
@@ -165,7 +168,10 @@ class TypeFormConnector:
             "completed": True  # Only get completed responses
         }
         
-        response = requests.get(endpoint, headers=self.headers, params=params)
+        with metrics.timer("fetch_seconds", host=self.host):
+            response = requests.get(endpoint, headers=self.headers, params=params, timeout=30)
+        metrics.increment("http_responses_total", host=self.host, status=response.status_code)
+        metrics.increment("bytes_downloaded_total", len(response.content), host=self.host)
         response.raise_for_status()
         
         return response.json()["items"]
@@ -0,0 +1,194 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+from src.data_ingestion.enrichment_jobs import store_submission
+from src.data_ingestion.typeform_connector import TypeFormConnector
+from src.database.db_manager import DatabaseManager
+from src.database.job_queue import JobQueue
+from src.utils.logger import log_context
+from src.utils.metrics import metrics
+
+MAX_BODY_BYTES = 1024 * 1024
+
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found',
+    405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error',
+}
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a ``Typeform-Signature: sha256=<base64 HMAC>`` header"""
+    if not signature or not signature.startswith('sha256='):
+        return False
+    digest = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).digest()
+    expected = 'sha256=' + base64.b64encode(digest).decode('ascii')
+    return hmac.compare_digest(expected, signature)
+
+
+def webhook_to_response(payload: Dict) -> Dict:
+    """Convert a webhook ``form_response`` into the responses API item shape"""
+    form_response = payload['form_response']
+    return {**form_response, 'response_id': form_response['token']}
+
+
+class TypeformWebhookServer:
+    """Asyncio HTTP endpoint receiving Typeform webhooks.
+
+    Verified submissions are collected for up to ``batch_window`` seconds
+    (or ``max_batch`` submissions) and written in one transaction, which
+    also queues their enrichment jobs. Each request is acknowledged only
+    after its batch commits, so Typeform redelivers anything that failed.
+    """
+
+    def __init__(self,
+                 db_manager: DatabaseManager,
+                 typeform: TypeFormConnector,
+                 secret: str,
+                 path: str = '/webhooks/typeform',
+                 batch_window: float = 0.5,
+                 max_batch: int = 50):
+        self.db_manager = db_manager
+        self.typeform = typeform
+        self.job_queue = JobQueue(db_manager)
+        self.secret = secret
+        self.path = path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.logger = logging.getLogger(__name__)
+        self._pending: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '0.0.0.0', port: int = 8080):
+        self._pending = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_writer())
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.logger.info(f"Listening for Typeform webhooks on {host}:{port}{self.path}")
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._batcher.cancel()
+
+    async def serve_forever(self, host: str = '0.0.0.0', port: int = 8080):
+        await self.start(host, port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, message = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, ValueError):
+            status, message = 400, 'malformed request'
+        except Exception as e:
+            self.logger.error(f"Webhook handling failed: {str(e)}")
+            status, message = 500, 'internal error'
+        metrics.increment('webhook_requests_total', status=status)
+
+        body = json.dumps({'status': message}).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode('ascii') + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[int, str]:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise ValueError('bad request line')
+        method, target, _ = request_line
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if target.split('?', 1)[0] != self.path:
+            return 404, 'not found'
+        if method != 'POST':
+            return 405, 'method not allowed'
+
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_BYTES:
+            return 413, 'payload too large'
+        body = await reader.readexactly(length)
+
+        if not verify_signature(self.secret, body, headers.get('typeform-signature')):
+            self.logger.warning("Rejected webhook with invalid signature")
+            return 401, 'invalid signature'
+
+        payload = json.loads(body)
+        if payload.get('event_type') != 'form_response' or 'form_response' not in payload:
+            return 200, 'ignored'
+
+        # Wait until the batch containing this submission is committed
+        done = asyncio.get_running_loop().create_future()
+        await self._pending.put((webhook_to_response(payload), done))
+        await done
+        return 200, 'stored'
+
+    async def _batch_writer(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # SQLAlchemy is synchronous; keep it off the event loop
+            errors = await loop.run_in_executor(None, self._store_batch, [item for item, _ in batch])
+            for (_, done), error in zip(batch, errors):
+                if done.done():
+                    continue
+                if error is None:
+                    done.set_result(None)
+                else:
+                    done.set_exception(error)
+
+    def _store_batch(self, responses: List[Dict]) -> List[Optional[Exception]]:
+        """Store a batch of submissions and queue enrichment in one transaction
+
+        If the batch fails, submissions are retried one by one so a single
+        bad payload does not reject the others. Returns the error (or None)
+        for each submission.
+        """
+        try:
+            with metrics.timer('webhook_batch_seconds'):
+                with self.db_manager.session_scope() as session:
+                    for response in responses:
+                        self._store(session, response)
+            metrics.increment('webhook_submissions_total', len(responses))
+            return [None] * len(responses)
+        except Exception as e:
+            if len(responses) == 1:
+                self.logger.error(f"Failed to store webhook submission: {str(e)}")
+                return [e]
+        return [self._store_batch([response])[0] for response in responses]
+
+    def _store(self, session, response: Dict):
+        with log_context(submission_id=response['response_id'], stage='webhook'):
+            startup = store_submission(session, self.typeform, self.job_queue, response)
+            if startup is not None:
+                self.logger.info(f"Added submission {response['response_id']} from webhook")
@@ -4,7 +4,18 @@ from typing import Dict, Optional, List
 import logging
 from urllib.parse import urljoin, urlparse
 import re
+from contextlib import contextmanager
 from src.models.website_data import WebsiteData
+from src.utils.metrics import metrics
+from src.utils.profiling import profile_stage
+
+@contextmanager
+def _extract_stage(name: str):
+    """Time one extraction step in the metrics and, when profiling, as its
+    own ``crawl.extract.<name>`` stage"""
+    with metrics.timer('parse_seconds', stage=name), profile_stage(f'crawl.extract.{name}'):
+        yield
+
 
 class WebsiteCrawler:
     def __init__(self):
@@ -15,11 +26,16 @@ class WebsiteCrawler:
         
     def fetch_website(self, url: str) -> Optional[str]:
         """Fetch website content"""
+        host = urlparse(url).netloc
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            with metrics.timer('fetch_seconds', host=host):
+                response = requests.get(url, headers=self.headers, timeout=10)
+            metrics.increment('http_responses_total', host=host, status=response.status_code)
+            metrics.increment('bytes_downloaded_total', len(response.content), host=host)
             response.raise_for_status()
             return response.text
         except Exception as e:
+            metrics.increment('fetch_errors_total', host=host)
             self.logger.error(f"Error fetching website {url}: {str(e)}")
             return None
     
@@ -146,9 +162,13 @@ class WebsiteCrawler:
         html_content = self.fetch_website(url)
         if not html_content:
             return None
-        
+        return self.parse_website(html_content, url, startup_id)
+    
+    def parse_website(self, html_content: str, url: str, startup_id: int) -> Optional[WebsiteData]:
+        """Extract all relevant data from already fetched HTML"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            with metrics.timer('parse_seconds', stage='html'), profile_stage('crawl.parse'):
+                soup = BeautifulSoup(html_content, 'html.parser')
             
             # Create website data object
             website_data = WebsiteData(
@@ -157,23 +177,29 @@ class WebsiteCrawler:
             )
             
             # Extract basic info
-            website_data.title = soup.title.string if soup.title else None
-            meta_description = soup.find('meta', {'name': 'description'})
-            website_data.description = meta_description['content'] if meta_description else None
-            
-            # Extract main content (first significant text block)
-            main_content = soup.find(['article', 'main', 'div'], 
-                class_=lambda x: x and ('content' in x.lower() or 'main' in x.lower()))
-            website_data.main_content = main_content.get_text() if main_content else None
+            with _extract_stage('basic'):
+                website_data.title = soup.title.string if soup.title else None
+                meta_description = soup.find('meta', {'name': 'description'})
+                website_data.description = meta_description['content'] if meta_description else None
+                
+                # Extract main content (first significant text block)
+                main_content = soup.find(['article', 'main', 'div'], 
+                    class_=lambda x: x and ('content' in x.lower() or 'main' in x.lower()))
+                website_data.main_content = main_content.get_text() if main_content else None
             
             # Extract other data
-            website_data.technologies = self.extract_technologies(soup)
-            website_data.team_members = self.extract_team_members(soup)
-            website_data.contact_info = self.extract_contact_info(soup)
-            website_data.social_links = self.extract_social_links(soup)
+            with _extract_stage('technologies'):
+                website_data.technologies = self.extract_technologies(soup)
+            with _extract_stage('team_members'):
+                website_data.team_members = self.extract_team_members(soup)
+            with _extract_stage('contact_info'):
+                website_data.contact_info = self.extract_contact_info(soup)
+            with _extract_stage('social_links'):
+                website_data.social_links = self.extract_social_links(soup)
             
             # Extract meta data
-            meta_data = self.extract_meta_data(soup)
+            with _extract_stage('meta_data'):
+                meta_data = self.extract_meta_data(soup)
             website_data.meta_tags = meta_data['meta_tags']
             website_data.og_tags = meta_data['og_tags']
             
@@ -1,18 +1,152 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
-from typing import List, Dict, Any
+from src.utils.metrics import metrics
+from typing import List, Dict, Any, Optional
+import threading
 import logging
+import time
 
 Base = declarative_base()
 
+
+class PoolStats:
+    """Thread-safe counters for connection checkout wait times"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def record(self, wait: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'avg_wait_ms': (self.total_wait / self.checkouts * 1000) if self.checkouts else 0.0,
+                'max_wait_ms': self.max_wait * 1000,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection"""
+    
+    def __init__(self, *args, stats: Optional[PoolStats] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats or PoolStats()
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.stats.record(time.perf_counter() - start)
+
+
 class DatabaseManager:
-    def __init__(self, connection_string: str):
-        self.engine = create_engine(connection_string)
+    def __init__(self,
+                 connection_string: str,
+                 read_replica_connection_string: Optional[str] = None,
+                 pool_size: int = 5,
+                 max_overflow: int = 10,
+                 pool_timeout: float = 30,
+                 pool_recycle: int = 1800,
+                 pool_pre_ping: bool = True,
+                 statement_timeout_ms: Optional[int] = None):
+        engine_options = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            statement_timeout_ms=statement_timeout_ms,
+        )
+        self.engine = self._create_engine(connection_string, **engine_options)
+        self.read_engine = (
+            self._create_engine(read_replica_connection_string, **engine_options)
+            if read_replica_connection_string else self.engine
+        )
         self.Session = sessionmaker(bind=self.engine)
+        self.ReadSession = sessionmaker(bind=self.read_engine)
         self.logger = logging.getLogger(__name__)
+        
+        event.listen(self.Session, 'before_flush', self._before_flush)
+        event.listen(self.Session, 'after_flush_postexec', self._after_flush)
+    
+    @classmethod
+    def from_config(cls, db_config: Dict[str, Any]) -> 'DatabaseManager':
+        """Create a manager from the ``database`` section of config.yaml"""
+        pool_config = db_config.get('pool') or {}
+        defaults = {
+            'size': 5, 'max_overflow': 10, 'timeout': 30,
+            'recycle': 1800, 'pre_ping': True,
+        }
+        pool_config = {**defaults, **pool_config}
+        return cls(
+            db_config['connection_string'],
+            read_replica_connection_string=db_config.get('read_replica_connection_string'),
+            pool_size=pool_config['size'],
+            max_overflow=pool_config['max_overflow'],
+            pool_timeout=pool_config['timeout'],
+            pool_recycle=pool_config['recycle'],
+            pool_pre_ping=pool_config['pre_ping'],
+            statement_timeout_ms=db_config.get('statement_timeout_ms'),
+        )
+    
+    @staticmethod
+    def _create_engine(connection_string: str,
+                       pool_size: int,
+                       max_overflow: int,
+                       pool_timeout: float,
+                       pool_recycle: int,
+                       pool_pre_ping: bool,
+                       statement_timeout_ms: Optional[int]):
+        """Create an engine with pool settings appropriate for the backend"""
+        backend = make_url(connection_string).get_backend_name()
+        if backend == 'sqlite':
+            # SQLite uses its own single-file pools; sizing does not apply
+            return create_engine(connection_string, pool_pre_ping=pool_pre_ping)
+        
+        connect_args = {}
+        if statement_timeout_ms and backend == 'postgresql':
+            connect_args['options'] = f'-c statement_timeout={int(statement_timeout_ms)}'
+        return create_engine(
+            connection_string,
+            poolclass=TimedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+        )
+    
+    @staticmethod
+    def _before_flush(session, flush_context, instances):
+        if metrics.enabled:
+            session.info['flush_started'] = time.perf_counter()
+    
+    @staticmethod
+    def _after_flush(session, flush_context):
+        started = session.info.pop('flush_started', None)
+        if started is not None:
+            metrics.observe('db_flush_seconds', time.perf_counter() - started)
+            metrics.increment('db_flushes_total')
     
     def init_db(self):
         """Initialize the database schema"""
@@ -23,12 +157,20 @@ class DatabaseManager:
         Base.metadata.drop_all(self.engine)
     
     @contextmanager
-    def session_scope(self):
-        """Provide a transactional scope around a series of operations"""
-        session = self.Session()
+    def session_scope(self, read_only: bool = False):
+        """Provide a transactional scope around a series of operations
+        
+        Read-only scopes run against the read replica when one is
+        configured and are rolled back instead of committed.
+        """
+        session = self.ReadSession() if read_only else self.Session()
         try:
             yield session
-            session.commit()
+            if read_only:
+                session.rollback()
+            else:
+                with metrics.timer('db_commit_seconds'):
+                    session.commit()
         except SQLAlchemyError as e:
             session.rollback()
             self.logger.error(f"Database error: {str(e)}")
@@ -46,12 +188,136 @@ class DatabaseManager:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
     
-    def get_table_stats(self) -> Dict[str, int]:
-        """Get row counts for all tables"""
+    def get_pool_status(self) -> Dict[str, Dict[str, Any]]:
+        """Report in-use counts and checkout wait times for each engine"""
+        engines = {'primary': self.engine}
+        if self.read_engine is not self.engine:
+            engines['replica'] = self.read_engine
+        
+        status = {}
+        for name, engine in engines.items():
+            pool = engine.pool
+            info = {'status': pool.status()}
+            if isinstance(pool, QueuePool):
+                info.update({
+                    'size': pool.size(),
+                    'checked_out': pool.checkedout(),
+                    'checked_in': pool.checkedin(),
+                    'overflow': pool.overflow(),
+                })
+            if isinstance(pool, TimedQueuePool):
+                info.update(pool.stats.snapshot())
+            status[name] = info
+        return status
+    
+    def get_table_stats(self, approximate: bool = False) -> Dict[str, int]:
+        """Get row counts for all tables in a single round trip
+        
+        With ``approximate=True`` counts come from planner statistics
+        (PostgreSQL ``pg_class.reltuples``, SQLite ``sqlite_stat1``) instead
+        of scanning each table. Tables without statistics yet fall back to
+        an exact count.
+        """
+        tables = list(Base.metadata.tables.values())
         stats = {}
-        for table in Base.metadata.tables:
-            with self.session_scope() as session:
-                count = session.query(text(f"SELECT COUNT(*) FROM {table}")).scalar()
-                stats[table] = count
+        with self.read_engine.connect() as conn:
+            if approximate:
+                stats = self._approximate_counts(conn, [t.name for t in tables])
+            missing = [t for t in tables if stats.get(t.name) is None]
+            if missing:
+                counts = select(*[
+                    select(func.count()).select_from(t).scalar_subquery().label(t.name)
+                    for t in missing
+                ])
+                stats.update(conn.execute(counts).one()._mapping)
+        return {t.name: stats[t.name] for t in tables}
+    
+    def _approximate_counts(self, conn, table_names: List[str]) -> Dict[str, Optional[int]]:
+        """Read estimated row counts from the backend's statistics tables"""
+        backend = conn.dialect.name
+        if backend == 'postgresql':
+            rows = conn.execute(
+                text(
+                    "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+                    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                    "WHERE c.relkind = 'r' AND n.nspname = current_schema() "
+                    "AND c.relname = ANY(:names)"
+                ),
+                {'names': table_names},
+            )
+            # reltuples is -1 for tables that were never analyzed
+            return {name: count for name, count in rows if count >= 0}
+        
+        if backend == 'sqlite':
+            has_stats = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )).first()
+            if not has_stats:
+                return {}
+            counts = {}
+            for table, stat in conn.execute(text("SELECT tbl, stat FROM sqlite_stat1")):
+                if table in table_names and stat:
+                    counts[table] = max(counts.get(table, 0), int(stat.split()[0]))
+            return counts
+        
+        return {}
+    
+    def get_storage_stats(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """Get row estimates and on-disk sizes (bytes) for all tables
+        
+        Reports heap, TOAST and index sizes on PostgreSQL and page usage from
+        the ``dbstat`` table on SQLite builds that include it. Sizes are None
+        where the backend cannot report them.
+        """
+        table_names = list(Base.metadata.tables)
+        stats = {
+            name: {'rows': None, 'table_bytes': None, 'toast_bytes': None, 'index_bytes': None}
+            for name in table_names
+        }
+        with self.read_engine.connect() as conn:
+            backend = conn.dialect.name
+            if backend == 'postgresql':
+                rows = conn.execute(
+                    text(
+                        "SELECT c.relname, c.reltuples::bigint, pg_relation_size(c.oid), "
+                        "CASE WHEN c.reltoastrelid = 0 THEN 0 "
+                        "ELSE pg_total_relation_size(c.reltoastrelid) END, "
+                        "pg_indexes_size(c.oid) "
+                        "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                        "WHERE c.relkind = 'r' AND n.nspname = current_schema() "
+                        "AND c.relname = ANY(:names)"
+                    ),
+                    {'names': table_names},
+                )
+                for name, row_count, table_bytes, toast_bytes, index_bytes in rows:
+                    stats[name].update({
+                        'rows': row_count if row_count >= 0 else None,
+                        'table_bytes': table_bytes,
+                        'toast_bytes': toast_bytes,
+                        'index_bytes': index_bytes,
+                    })
+            elif backend == 'sqlite':
+                for name, count in self._approximate_counts(conn, table_names).items():
+                    stats[name]['rows'] = count
+                try:
+                    rows = conn.execute(text(
+                        "SELECT m.tbl_name, m.type, SUM(d.pgsize) FROM dbstat d "
+                        "JOIN sqlite_master m ON m.name = d.name "
+                        "GROUP BY m.tbl_name, m.type"
+                    )).all()
+                except SQLAlchemyError:
+                    # SQLite built without SQLITE_ENABLE_DBSTAT_VTAB
+                    rows = []
+                for name, kind, size in rows:
+                    if name not in stats:
+                        continue
+                    key = 'table_bytes' if kind == 'table' else 'index_bytes'
+                    stats[name][key] = (stats[name][key] or 0) + size
+        
+        for table_stats in stats.values():
+            sizes = [table_stats[k] for k in ('table_bytes', 'toast_bytes', 'index_bytes')]
+            table_stats['total_bytes'] = (
+                sum(size for size in sizes if size is not None)
+                if any(size is not None for size in sizes) else None
+            )
         return stats
-
@@ -0,0 +1,251 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+from src.database.db_manager import DatabaseManager
+from src.models.enrichment_job import EnrichmentJob
+from src.utils.metrics import metrics
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+
+# Job kinds created by the Typeform import
+ENRICH_LINKEDIN = 'enrich-linkedin'
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+DEAD = 'dead'
+
+
+@dataclass
+class ClaimedJob:
+    """Snapshot of a job leased to a worker"""
+    id: int
+    kind: str
+    startup_id: Optional[int]
+    payload: Optional[Dict[str, Any]]
+    attempts: int
+    claim_token: str
+
+
+class LeaseLost(Exception):
+    """The job's lease expired and it was claimed by another worker"""
+
+
+class JobQueue:
+    """Database-backed queue of enrichment jobs with leases and retries.
+
+    Workers claim due jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` on
+    PostgreSQL, or a single conditional ``UPDATE`` on SQLite (which
+    serializes writers). A claimed job is leased for ``lease_seconds``; if
+    the worker dies the lease expires and another worker picks it up.
+    Failures are retried with exponential backoff until ``max_attempts``,
+    after which the job is moved to the dead state.
+    """
+
+    def __init__(self,
+                 db_manager: DatabaseManager,
+                 lease_seconds: int = 300,
+                 retry_base_seconds: float = 30,
+                 retry_max_seconds: float = 3600):
+        self.db_manager = db_manager
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.logger = logging.getLogger(__name__)
+
+    def enqueue(self,
+                session: Session,
+                kind: str,
+                startup_id: Optional[int] = None,
+                payload: Optional[Dict[str, Any]] = None,
+                max_attempts: int = 5) -> bool:
+        """Add a job in the caller's transaction; returns False if it already exists"""
+        exists = session.execute(
+            select(EnrichmentJob.id).where(
+                EnrichmentJob.kind == kind,
+                EnrichmentJob.startup_id == startup_id,
+            )
+        ).first()
+        if exists:
+            return False
+        session.add(EnrichmentJob(
+            kind=kind,
+            startup_id=startup_id,
+            payload=payload,
+            max_attempts=max_attempts,
+        ))
+        return True
+
+    def claim(self,
+              worker_id: str,
+              kinds: Optional[Sequence[str]] = None,
+              limit: int = 1) -> List[ClaimedJob]:
+        """Lease up to ``limit`` due jobs to ``worker_id``"""
+        now = datetime.utcnow()
+        token = uuid.uuid4().hex
+        due = or_(
+            (EnrichmentJob.status == PENDING) & (EnrichmentJob.run_after <= now),
+            (EnrichmentJob.status == RUNNING) & (EnrichmentJob.lease_expires_at < now),
+        )
+        candidates = select(EnrichmentJob.id).where(due).order_by(EnrichmentJob.run_after).limit(limit)
+        if kinds:
+            candidates = candidates.where(EnrichmentJob.kind.in_(list(kinds)))
+
+        with self.db_manager.session_scope() as session:
+            if session.bind.dialect.name == 'postgresql':
+                ids = session.scalars(candidates.with_for_update(skip_locked=True)).all()
+                if not ids:
+                    return []
+                target = EnrichmentJob.id.in_(ids)
+            else:
+                # Re-check the due condition so a row claimed between the
+                # subquery and the update cannot be taken twice
+                target = EnrichmentJob.id.in_(candidates.scalar_subquery()) & due
+
+            session.execute(
+                update(EnrichmentJob)
+                .where(target)
+                .values(
+                    status=RUNNING,
+                    claim_token=token,
+                    locked_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                    attempts=EnrichmentJob.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            rows = session.execute(
+                select(
+                    EnrichmentJob.id, EnrichmentJob.kind, EnrichmentJob.startup_id,
+                    EnrichmentJob.payload, EnrichmentJob.attempts,
+                ).where(EnrichmentJob.claim_token == token)
+            ).all()
+        metrics.increment('jobs_claimed_total', len(rows))
+        return [ClaimedJob(*row, claim_token=token) for row in rows]
+
+    def complete(self, session: Session, job: ClaimedJob):
+        """Mark a job done in the same transaction as its results"""
+        result = session.execute(
+            update(EnrichmentJob)
+            .where(EnrichmentJob.id == job.id, EnrichmentJob.claim_token == job.claim_token)
+            .values(status=DONE, claim_token=None, lease_expires_at=None, last_error=None)
+        )
+        if result.rowcount != 1:
+            raise LeaseLost(f"Lease lost for job {job.id}")
+
+    def fail(self, job: ClaimedJob, error: str):
+        """Schedule a retry with exponential backoff, or dead-letter the job"""
+        with self.db_manager.session_scope() as session:
+            row = session.get(EnrichmentJob, job.id)
+            if row is None or row.claim_token != job.claim_token:
+                return
+            row.last_error = error
+            row.claim_token = None
+            row.lease_expires_at = None
+            if row.attempts >= row.max_attempts:
+                row.status = DEAD
+                metrics.increment('jobs_dead_total', kind=job.kind)
+                self.logger.error(f"Job {job.id} ({job.kind}) dead after {row.attempts} attempts: {error}")
+            else:
+                delay = min(self.retry_base_seconds * 2 ** (row.attempts - 1), self.retry_max_seconds)
+                delay *= random.uniform(0.9, 1.1)
+                row.status = PENDING
+                row.run_after = datetime.utcnow() + timedelta(seconds=delay)
+                metrics.increment('job_retries_total', kind=job.kind)
+                self.logger.warning(f"Job {job.id} ({job.kind}) failed, retrying in {delay:.0f}s: {error}")
+
+    def requeue_dead(self, kind: Optional[str] = None) -> int:
+        """Move dead jobs back to pending with a fresh attempt budget"""
+        stmt = update(EnrichmentJob).where(EnrichmentJob.status == DEAD)
+        if kind:
+            stmt = stmt.where(EnrichmentJob.kind == kind)
+        with self.db_manager.session_scope() as session:
+            result = session.execute(
+                stmt.values(status=PENDING, attempts=0, run_after=datetime.utcnow())
+            )
+            return result.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each status"""
+        with self.db_manager.session_scope(read_only=True) as session:
+            rows = session.execute(
+                select(EnrichmentJob.status, func.count()).group_by(EnrichmentJob.status)
+            ).all()
+        return {status: count for status, count in rows}
+
+
+# A handler does its slow work (network calls) outside any transaction and
+# returns the write step, if any, which runs in the transaction that
+# completes the job
+JobStore = Callable[[Session], None]
+JobHandler = Callable[[ClaimedJob], Optional[JobStore]]
+
+
+class JobWorker:
+    """Claims jobs and runs the handler registered for their kind"""
+
+    def __init__(self,
+                 queue: JobQueue,
+                 handlers: Dict[str, JobHandler],
+                 worker_id: Optional[str] = None,
+                 batch_size: int = 10,
+                 poll_interval: float = 1.0):
+        self.queue = queue
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+
+    def run_job(self, job: ClaimedJob) -> bool:
+        """Run one claimed job; returns True on success"""
+        try:
+            with metrics.timer('job_seconds', kind=job.kind):
+                store = self.handlers[job.kind](job)
+                with self.queue.db_manager.session_scope() as session:
+                    if store is not None:
+                        store(session)
+                    self.queue.complete(session, job)
+            return True
+        except LeaseLost as e:
+            self.logger.warning(str(e))
+            return False
+        except Exception as e:
+            self.queue.fail(job, f"{type(e).__name__}: {e}")
+            return False
+
+    def run(self, stop_when_idle: bool = False) -> int:
+        """Process jobs until the queue is empty (or forever); returns jobs run
+
+        Running forever, database errors (e.g. SQLite "database is locked")
+        are logged and the worker keeps polling instead of exiting.
+        """
+        processed = 0
+        while True:
+            try:
+                jobs = self.queue.claim(self.worker_id, kinds=list(self.handlers), limit=self.batch_size)
+            except Exception as e:
+                if stop_when_idle:
+                    raise
+                self.logger.error(f"Claiming jobs failed, retrying: {str(e)}")
+                time.sleep(self.poll_interval)
+                continue
+            if not jobs:
+                if stop_when_idle:
+                    return processed
+                time.sleep(self.poll_interval)
+                continue
+            for job in jobs:
+                try:
+                    self.run_job(job)
+                except Exception as e:
+                    # Recording the failure itself failed; the lease expires
+                    # and the job is claimed again
+                    self.logger.error(f"Job {job.id} ({job.kind}) could not be finished: {str(e)}")
+                processed += 1
@@ -0,0 +1,134 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer, selectinload
+from src.models.startup import Startup
+from src.models.linkedin_profile import LinkedInProfile
+from src.models.website_data import WebsiteData
+
+# Relationship prefixes accepted by StartupRepository.project()
+_PROJECTION_SOURCES = {
+    'startup': Startup,
+    'linkedin_profile': LinkedInProfile,
+    'website_data': WebsiteData,
+}
+
+
+class StartupRepository:
+    """Read-side queries for full startup dossiers.
+
+    Dossiers load the LinkedIn profile and website data in a fixed number of
+    queries (one per relationship, regardless of how many startups) and skip
+    the raw blob columns unless ``include_raw`` is set.
+    ``include_profile_details`` loads only the LinkedIn ``raw_data`` (read by
+    ``experiences``, ``education`` and ``accomplishments``) in the same
+    query, leaving the Typeform and HTML blobs deferred.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _dossier_options(self, include_raw: bool, include_profile_details: bool = False) -> list:
+        profile_loader = selectinload(Startup.linkedin_profile)
+        website_loader = selectinload(Startup.website_data)
+        if include_profile_details:
+            profile_loader = profile_loader.undefer_group('raw')
+        if not include_raw:
+            return [
+                defer(Startup.raw_typeform_data),
+                profile_loader,
+                website_loader.defer(WebsiteData.raw_html),
+            ]
+        return [
+            profile_loader.undefer_group('raw'),
+            website_loader,
+        ]
+
+    def get_dossier(self,
+                    startup_id: int,
+                    include_raw: bool = False,
+                    include_profile_details: bool = False) -> Optional[Startup]:
+        """Load a single startup with its profile and website data"""
+        stmt = (
+            select(Startup)
+            .where(Startup.id == startup_id)
+            .options(*self._dossier_options(include_raw, include_profile_details))
+        )
+        return self.session.scalars(stmt).first()
+
+    def list_dossiers(self,
+                      limit: Optional[int] = None,
+                      offset: int = 0,
+                      include_raw: bool = False,
+                      include_profile_details: bool = False) -> List[Startup]:
+        """Load startups ordered by id with profile and website data"""
+        stmt = (
+            select(Startup)
+            .order_by(Startup.id)
+            .options(*self._dossier_options(include_raw, include_profile_details))
+            .offset(offset)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(self.session.scalars(stmt))
+
+    def stream_dossiers(self,
+                        chunk_size: int = 500,
+                        include_raw: bool = False,
+                        include_profile_details: bool = False) -> Iterator[List[Startup]]:
+        """Yield dossiers in chunks using keyset pagination on id.
+
+        Each chunk costs a constant number of queries and is expunged from
+        the session before the next one is loaded, so memory stays flat
+        during exports.
+        """
+        last_id = 0
+        while True:
+            stmt = (
+                select(Startup)
+                .where(Startup.id > last_id)
+                .order_by(Startup.id)
+                .limit(chunk_size)
+                .options(*self._dossier_options(include_raw, include_profile_details))
+            )
+            chunk = list(self.session.scalars(stmt))
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1].id
+            for startup in chunk:
+                for related in (startup.linkedin_profile, startup.website_data):
+                    if related is not None:
+                        self.session.expunge(related)
+                self.session.expunge(startup)
+
+    def project(self,
+                columns: Sequence[str],
+                chunk_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield plain dicts for the requested columns.
+
+        Columns are given as ``"company_name"`` (startup columns) or
+        ``"linkedin_profile.full_name"`` / ``"website_data.title"``; related
+        tables are outer-joined only when referenced. With ``chunk_size``
+        rows are fetched through a streaming cursor.
+        """
+        selected = []
+        joined = set()
+        for name in columns:
+            source, _, attr = name.rpartition('.')
+            model = _PROJECTION_SOURCES.get(source or 'startup')
+            if model is None or attr not in model.__table__.columns:
+                raise ValueError(f"Unknown column for projection: {name}")
+            selected.append(getattr(model, attr).label(name))
+            if model is not Startup:
+                joined.add(model)
+
+        stmt = select(*selected).select_from(Startup)
+        for model in (LinkedInProfile, WebsiteData):
+            if model in joined:
+                stmt = stmt.outerjoin(model, model.startup_id == Startup.id)
+        stmt = stmt.order_by(Startup.id)
+
+        if chunk_size:
+            stmt = stmt.execution_options(yield_per=chunk_size)
+        for row in self.session.execute(stmt):
+            yield dict(row._mapping)
@@ -0,0 +1,258 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, Numeric, Table, select
+from src.database.db_manager import Base, DatabaseManager
+from src.database.types import CompressedJSON
+import src.models  # registers all tables on Base.metadata
+import json
+import logging
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Blob columns left out of snapshots unless explicitly requested
+DEFAULT_EXCLUDE = {
+    'startups': ['raw_typeform_data'],
+    'linkedin_profiles': ['raw_data'],
+    'website_data': ['raw_html', 'main_content'],
+}
+
+# JSON object columns expanded into one column per key ("social_links.github")
+DEFAULT_FLATTEN = {
+    'website_data': ['contact_info', 'social_links', 'og_tags'],
+}
+
+MANIFEST_NAME = '_manifest.json'
+
+# Column kinds; every partition of a table uses the kinds in the manifest
+KIND_INT, KIND_FLOAT, KIND_BOOL, KIND_DATETIME, KIND_STRING = 'int', 'float', 'bool', 'datetime', 'string'
+
+
+class SnapshotExporter:
+    """Stream tables into partitioned columnar files for analytics.
+
+    Rows are read in chunks through a streaming (server-side on PostgreSQL)
+    cursor and each chunk becomes one partition file under
+    ``<output_dir>/<table>/``. Formats: ``arrow`` (Arrow IPC, memory-mappable),
+    ``parquet``, or ``npz`` (compressed NumPy, used when pyarrow is not
+    installed).
+
+    Incremental exports only write rows whose ``updated_at`` is newer than
+    the watermark recorded in ``_manifest.json`` by the previous run; newer
+    partitions supersede older rows with the same ``id``. ``updated_at`` is
+    set client-side before commit, so a row can become visible after an
+    export has already read past its timestamp: each run re-reads an
+    ``overlap`` window below the watermark and skips rows it has already
+    written with the same ``updated_at``.
+
+    Column types come from the table definition, and flattened JSON keys
+    are always strings. Each table's columns and kinds are recorded in the
+    manifest (``columns``) and every partition is written with the columns
+    known so far, so the partitions read as one dataset with that schema.
+    Keys are picked up from the rows as they are written; a key first seen
+    in a later partition adds a column that earlier partitions read as null.
+    """
+
+    def __init__(self,
+                 db_manager: DatabaseManager,
+                 output_dir: str,
+                 fmt: Optional[str] = None,
+                 chunk_size: int = 10000,
+                 exclude: Optional[Dict[str, Sequence[str]]] = None,
+                 flatten: Optional[Dict[str, Sequence[str]]] = None,
+                 overlap: timedelta = timedelta(minutes=5)):
+        self.db_manager = db_manager
+        self.output_dir = Path(output_dir)
+        self.fmt = fmt or ('arrow' if pa is not None else 'npz')
+        if self.fmt in ('arrow', 'parquet') and pa is None:
+            raise ValueError(f"Format '{self.fmt}' requires pyarrow; use 'npz' instead")
+        if self.fmt not in ('arrow', 'parquet', 'npz'):
+            raise ValueError(f"Unknown snapshot format: {self.fmt}")
+        self.chunk_size = chunk_size
+        self.exclude = DEFAULT_EXCLUDE if exclude is None else exclude
+        self.flatten = DEFAULT_FLATTEN if flatten is None else flatten
+        self.overlap = overlap
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_dir / MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self.manifest_path.exists():
+            return json.loads(self.manifest_path.read_text())
+        return {}
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        tmp_path = self.manifest_path.with_name(MANIFEST_NAME + '.tmp')
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        tmp_path.replace(self.manifest_path)
+
+    def export(self,
+               tables: Iterable[str] = ('startups', 'linkedin_profiles', 'website_data'),
+               incremental: bool = True) -> Dict[str, int]:
+        """Export each table; returns rows written per table"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        run_id = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+        written = {}
+        for name in tables:
+            table = Base.metadata.tables[name]
+            state = manifest.get(name, {}) if incremental else {}
+            rows, state = self._export_table(table, state, run_id)
+            if not incremental:
+                # A full export replaces the previous partitions
+                for old_file in manifest.get(name, {}).get('files', []):
+                    (self.output_dir / old_file).unlink(missing_ok=True)
+            manifest[name] = state
+            written[name] = rows
+            self.logger.info(f"Exported {rows} rows from {name}")
+        self._save_manifest(manifest)
+        return written
+
+    def _export_table(self, table: Table, state: Dict[str, Any], run_id: str):
+        """Write new partitions for ``table``; returns (rows, new manifest state)"""
+        excluded = set(self.exclude.get(table.name, ()))
+        columns = [c for c in table.columns if c.name not in excluded]
+        json_columns = {c.name for c in columns if isinstance(c.type, (JSON, CompressedJSON))}
+        flatten = [c for c in columns if c.name in set(self.flatten.get(table.name, ())) & json_columns]
+        flatten_names = {c.name for c in flatten}
+
+        watermark = datetime.fromisoformat(state['watermark']) if state.get('watermark') else None
+        condition = table.c.updated_at > watermark - self.overlap if watermark is not None else None
+        # Rows already written from the overlap window: id -> updated_at
+        seen = state.get('recent', {})
+
+        schema = dict(state.get('columns', {}))
+        for column in columns:
+            if column.name not in flatten_names:
+                schema.setdefault(column.name, _column_kind(column))
+
+        stmt = select(*columns).order_by(table.c.updated_at, table.c.id)
+        if condition is not None:
+            stmt = stmt.where(condition)
+        stmt = stmt.execution_options(yield_per=self.chunk_size)
+
+        table_dir = self.output_dir / table.name
+        table_dir.mkdir(exist_ok=True)
+        rows_written = 0
+        files = []
+        recent = {}
+        with self.db_manager.read_engine.connect() as conn:
+            result = conn.execute(stmt)
+            for chunk in result.mappings().partitions():
+                records = []
+                for row in chunk:
+                    updated = row['updated_at'].isoformat() if row['updated_at'] is not None else None
+                    recent[str(row['id'])] = updated
+                    if seen.get(str(row['id'])) == updated:
+                        continue
+                    records.append(self._flatten_row(row, json_columns, flatten_names))
+                    if updated is not None and (watermark is None or row['updated_at'] > watermark):
+                        watermark = row['updated_at']
+                if not records:
+                    continue
+                # Appended, so earlier partitions keep a prefix of the schema
+                for key in sorted({key for record in records for key in record} - schema.keys()):
+                    schema[key] = KIND_STRING
+                path = table_dir / f"part-{run_id}-{len(files):05d}.{self._extension}"
+                self._write_partition(path, records, schema)
+                files.append(str(path.relative_to(self.output_dir)))
+                rows_written += len(records)
+
+        if watermark is not None:
+            cutoff = (watermark - self.overlap).isoformat()
+            recent = {key: updated for key, updated in recent.items() if updated is not None and updated > cutoff}
+        return rows_written, {
+            'watermark': watermark.isoformat() if watermark is not None else None,
+            'files': state.get('files', []) + files,
+            'format': self.fmt,
+            'columns': schema,
+            'recent': recent,
+        }
+
+    @staticmethod
+    def _flatten_row(row, json_columns: set, flatten: set) -> Dict[str, Any]:
+        record = {}
+        for key, value in row.items():
+            if key in flatten:
+                for sub_key, sub_value in (value or {}).items():
+                    if sub_value is not None and not isinstance(sub_value, str):
+                        sub_value = json.dumps(sub_value)
+                    record[f"{key}.{sub_key}"] = sub_value
+            elif key in json_columns:
+                record[key] = json.dumps(value) if value is not None else None
+            else:
+                record[key] = value
+        return record
+
+    @property
+    def _extension(self) -> str:
+        return {'arrow': 'arrow', 'parquet': 'parquet', 'npz': 'npz'}[self.fmt]
+
+    def _write_partition(self, path: Path, records: List[Dict[str, Any]], schema: Dict[str, str]):
+        columns = {name: [record.get(name) for record in records] for name in schema}
+        if self.fmt == 'npz':
+            arrays = {}
+            for name, values in columns.items():
+                arrays.update(_to_numpy(name, values, schema[name]))
+            np.savez_compressed(path, **arrays)
+            return
+        arrow_schema = arrow_schema_for(schema)
+        arrow_table = pa.table(
+            {name: pa.array(values, type=arrow_schema.field(name).type) for name, values in columns.items()},
+            schema=arrow_schema,
+        )
+        if self.fmt == 'parquet':
+            pq.write_table(arrow_table, path, compression='zstd')
+        else:
+            # Uncompressed IPC so readers can memory-map without copying
+            feather.write_feather(arrow_table, path, compression='uncompressed')
+
+
+def _column_kind(column: Column) -> str:
+    if isinstance(column.type, Boolean):
+        return KIND_BOOL
+    if isinstance(column.type, Integer):
+        return KIND_INT
+    if isinstance(column.type, (Float, Numeric)):
+        return KIND_FLOAT
+    if isinstance(column.type, DateTime):
+        return KIND_DATETIME
+    return KIND_STRING
+
+
+def arrow_schema_for(columns: Dict[str, str]):
+    """Arrow schema for a table's manifest ``columns``, for reading the
+    partitions as one dataset"""
+    types = {
+        KIND_INT: pa.int64(), KIND_FLOAT: pa.float64(), KIND_BOOL: pa.bool_(),
+        KIND_DATETIME: pa.timestamp('us'), KIND_STRING: pa.string(),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+
+def _to_numpy(name: str, values: List[Any], kind: str) -> Dict[str, np.ndarray]:
+    """Array of the column's fixed dtype, plus a null mask when needed"""
+    nulls = np.array([v is None for v in values])
+    if kind == KIND_BOOL:
+        array = np.array([bool(v) for v in values], dtype=np.bool_)
+    elif kind == KIND_INT:
+        array = np.array([0 if v is None else v for v in values], dtype=np.int64)
+    elif kind == KIND_FLOAT:
+        array = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    elif kind == KIND_DATETIME:
+        array = np.array([np.datetime64('NaT') if v is None else np.datetime64(v, 'us') for v in values],
+                         dtype='datetime64[us]')
+    else:
+        array = np.array(['' if v is None else str(v) for v in values], dtype=np.str_)
+    arrays = {name: array}
+    if nulls.any():
+        arrays[f"{name}.__null"] = nulls
+    return arrays
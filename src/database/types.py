@@ -0,0 +1,47 @@
+import json
+import zlib
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
+
+# JSON column that becomes JSONB (indexable, binary) on PostgreSQL
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON document stored as a zlib-compressed blob"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, level: int = 6, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.level = level
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        payload = json.dumps(value, separators=(',', ':'), default=str)
+        return zlib.compress(payload.encode('utf-8'), self.level)
+
+    def result_processor(self, dialect, coltype):
+        # Skip the binary impl's processor: rows written before the column
+        # was compressed come back as JSON (dict, str) rather than bytes
+        return lambda value: self.process_result_value(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (dict, list)):
+            # Legacy JSON column, already decoded by the driver
+            return value
+        if isinstance(value, str):
+            # Legacy JSON text (SQLite)
+            return json.loads(value)
+        value = bytes(value)
+        try:
+            value = zlib.decompress(value)
+        except zlib.error:
+            # Uncompressed JSON bytes left by scripts/migrate_raw_data.py
+            pass
+        return json.loads(value.decode('utf-8'))
@@ -1,5 +1,8 @@
 from src.models.startup import Startup
 from src.models.linkedin_profile import LinkedInProfile
+from src.models.website_data import WebsiteData
+from src.models.enrichment_job import EnrichmentJob
+from src.models.crawl_frontier import CrawlFrontierEntry, CrawlDomain
 
 # This ensures all models are registered
-__all__ = ['Startup', 'LinkedInProfile']
+__all__ = ['Startup', 'LinkedInProfile', 'WebsiteData', 'EnrichmentJob', 'CrawlFrontierEntry', 'CrawlDomain']
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Float, Text, Index
+from src.database.db_manager import Base
+from datetime import datetime
+
+class CrawlFrontierEntry(Base):
+    __tablename__ = 'crawl_frontier'
+    __table_args__ = (
+        Index('ix_crawl_frontier_due', 'next_due_at', 'priority'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # One entry per normalized URL, shared by every startup that lists it
+    url = Column(String, unique=True, nullable=False)
+    domain = Column(String, nullable=False, index=True)
+    startup_ids = Column(JSON)
+    
+    # Scheduling - among due entries the highest priority + score + days
+    # overdue is crawled first (see CrawlScheduler)
+    priority = Column(Float, nullable=False, default=0)
+    score = Column(Float, nullable=False, default=0)  # best startup score, 0-1
+    next_due_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_crawled_at = Column(DateTime)
+    error_count = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    
+    # Lease held by the scheduler currently crawling this entry
+    claim_token = Column(String)
+    lease_expires_at = Column(DateTime)
+
+class CrawlDomain(Base):
+    __tablename__ = 'crawl_domains'
+    
+    domain = Column(String, primary_key=True)
+    
+    # Earliest time the next request to this domain may be sent (politeness
+    # delay after a fetch, exponential backoff after errors)
+    next_allowed_at = Column(DateTime)
+    last_fetch_at = Column(DateTime)
+    consecutive_errors = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, JSON, ForeignKey, DateTime, Text, Index, UniqueConstraint
+from src.database.db_manager import Base
+from datetime import datetime
+
+class EnrichmentJob(Base):
+    __tablename__ = 'enrichment_jobs'
+    __table_args__ = (
+        # One job per kind and startup, so re-enqueueing after a crash is a no-op
+        UniqueConstraint('kind', 'startup_id', name='uq_enrichment_jobs_kind_startup'),
+        Index('ix_enrichment_jobs_claim', 'status', 'run_after'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    startup_id = Column(Integer, ForeignKey('startups.id'))
+    payload = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Scheduling: pending -> running -> done, or back to pending with a
+    # backoff until max_attempts is reached, then dead
+    status = Column(String, nullable=False, default='pending')
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    
+    # Lease held by the worker currently running the job
+    claim_token = Column(String)
+    locked_by = Column(String)
+    lease_expires_at = Column(DateTime)
+    
+    last_error = Column(Text)
@@ -1,10 +1,20 @@
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship, deferred
 from src.database.db_manager import Base
+from src.database.types import JSONType, CompressedJSON
 from datetime import datetime
 
 class LinkedInProfile(Base):
     __tablename__ = 'linkedin_profiles'
+    __table_args__ = (
+        # GIN index for skill containment queries (PostgreSQL only)
+        Index(
+            'ix_linkedin_profiles_skills',
+            'skills',
+            postgresql_using='gin',
+            postgresql_ops={'skills': 'jsonb_path_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
     
     id = Column(Integer, primary_key=True)
     startup_id = Column(Integer, ForeignKey('startups.id'))
@@ -18,19 +28,35 @@ class LinkedInProfile(Base):
     country = Column(String)
     city = Column(String)
     
-    # Experience and Education
-    experiences = Column(JSON)  # Store full work history
-    education = Column(JSON)    # Store education history
-    
-    # Skills and Accomplishments
-    skills = Column(JSON)
-    accomplishments = Column(JSON)
+    # Skills (kept as a small queryable column, JSONB on PostgreSQL)
+    skills = Column(JSONType)
     
     # Network Info
     connections_count = Column(Integer)
     
-    # Raw Data
-    raw_data = Column(JSON)  # Store complete raw response
+    # Raw Data - the only copy of the full response, compressed and
+    # only loaded when one of the derived fields below is accessed
+    raw_data = deferred(Column(CompressedJSON), group='raw')
     
     # Relationship
-    startup = relationship("Startup", back_populates="linkedin_profile") 
\ No newline at end of file
+    startup = relationship("Startup", back_populates="linkedin_profile")
+    
+    def _raw_field(self, key: str) -> list:
+        return (self.raw_data or {}).get(key) or []
+    
+    # Experience and Education (derived from raw_data)
+    @property
+    def experiences(self) -> list:
+        """Full work history"""
+        return self._raw_field('experiences')
+    
+    @property
+    def education(self) -> list:
+        """Education history"""
+        return self._raw_field('education')
+    
+    # Accomplishments (derived from raw_data)
+    @property
+    def accomplishments(self) -> dict:
+        """Accomplishments, keyed by type (projects, publications, ...)"""
+        return (self.raw_data or {}).get('accomplishments') or {}
@@ -1,24 +1,187 @@
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
 import yaml
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "config.yaml"
+
+DEFAULT_LOGGING_CONFIG = {
+    "level": "INFO",
+    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    "json": False,
+    "file": None,
+}
+
+# Per-record context (submission_id, url, stage, ...) for the current task
+_log_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default={})
+
+_setup_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+
+@lru_cache(maxsize=1)
+def load_logging_config() -> Dict[str, Any]:
+    """Read the logging section of config.yaml once per process"""
+    config = {}
+    if CONFIG_PATH.exists():
+        with open(CONFIG_PATH) as f:
+            config = (yaml.safe_load(f) or {}).get("logging") or {}
+    return {**DEFAULT_LOGGING_CONFIG, **config}
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach fields to every record logged inside this block"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the current log context onto the record in the caller's thread"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = _log_context.get()
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    """Configured text format with any context fields appended"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        # Before the traceback, which format() appends afterwards
+        message = super().formatMessage(record)
+        context = getattr(record, "context", None)
+        if context:
+            fields = " ".join(f"{key}={value}" for key, value in context.items())
+            message = f"{message} [{fields}]"
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including context fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "context", None) or {})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the traceback out of the message
+
+    The stock ``prepare()`` formats the traceback into ``msg``; here it is
+    rendered into ``exc_text`` instead, so the formatters on the listener
+    side can place it (``JsonFormatter`` emits it as ``exception``).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _start_listener() -> logging.Handler:
+    """Install the shared queue handler on the root logger and start the
+    background writer, so module loggers (``logging.getLogger(__name__)``)
+    go through it as well"""
+    global _queue_handler, _listener
+    config = load_logging_config()
+
+    if config["json"]:
+        formatter = JsonFormatter()
+    else:
+        formatter = TextFormatter(config["format"])
+
+    handlers = [logging.StreamHandler()]
+    if config["file"]:
+        handlers.append(logging.FileHandler(config["file"]))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = ContextQueueHandler(log_queue)
+    _queue_handler.addFilter(ContextFilter())
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(config["level"])
+    root.addHandler(_queue_handler)
+    atexit.register(shutdown_logging)
+    return _queue_handler
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _listener is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+            _listener.stop()
+            _listener = None
+            _queue_handler = None
+
+
+def _restart_after_fork():
+    """Give a forked child its own writer thread
+
+    The child inherits the root queue handler but not the listener thread,
+    so records would pile up in a queue nobody reads. The inherited handler
+    is dropped and a fresh listener started in its place.
+    """
+    global _setup_lock, _listener, _queue_handler
+    _setup_lock = threading.Lock()
+    if _listener is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener = None
+        _queue_handler = None
+        _start_listener()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
 
 def setup_logger(name: str) -> logging.Logger:
-    """Set up and return a logger instance"""
-    
-    # Load config
-    config_path = Path(__file__).parent.parent.parent / "config" / "config.yaml"
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
-    
-    # Create logger
+    """Set up and return a logger instance
+
+    The first call installs the queue handler on the root logger: records
+    from every logger are handed to a queue and written by a background
+    thread, so callers never block on stream or file I/O. Named loggers
+    only get the configured level and reach the handler by propagation,
+    so each record is written once.
+    """
+    with _setup_lock:
+        if _listener is None:
+            _start_listener()
+
     logger = logging.getLogger(name)
-    logger.setLevel(config["logging"]["level"])
-    
-    # Create handler
-    handler = logging.StreamHandler()
-    handler.setFormatter(
-        logging.Formatter(config["logging"]["format"])
-    )
-    
-    logger.addHandler(handler)
+    logger.setLevel(load_logging_config()["level"])
     return logger
@@ -0,0 +1,248 @@
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (Prometheus defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> LabelKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: Any) -> str:
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _display_name(item: Dict[str, Any]) -> str:
+    if not item['labels']:
+        return item['name']
+    labels = ','.join(f'{k}={v}' for k, v in item['labels'].items())
+    return f"{item['name']}{{{labels}}}"
+
+
+class Histogram:
+    """Bucketed distribution of observed values"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+        }
+
+
+class _NullTimer:
+    """Shared no-op context manager returned while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """In-process counters and histograms for the ingestion pipeline.
+
+    Disabled by default; every recording call returns immediately until
+    ``enable()`` is called, so instrumented code pays a single attribute
+    check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._counters: Dict[LabelKey, float] = {}
+        self._histograms: Dict[LabelKey, Histogram] = {}
+
+    def enable(self, enabled: bool = True):
+        self.enabled = enabled
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def increment(self, name: str, value: float = 1, **labels):
+        """Add ``value`` to a counter"""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record a value in a histogram"""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def timer(self, name: str, **labels):
+        """Context manager recording elapsed seconds into histogram ``name``"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name, labels)
+
+    @contextmanager
+    def _timer(self, name: str, labels: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, **labels):
+        """Decorator form of ``timer``"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._timer(name, labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict[str, list]:
+        """Return all metrics as plain, JSON-serializable data"""
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {'name': name, 'labels': dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {'counters': counters, 'histograms': histograms}
+
+    def summary(self) -> str:
+        """Human-readable end-of-run report"""
+        snapshot = self.snapshot()
+        lines = ['Pipeline metrics:']
+        for item in snapshot['histograms']:
+            lines.append(
+                f"  {_display_name(item)}: n={item['count']} "
+                f"total={item['sum']:.3f}s avg={item['avg'] * 1000:.1f}ms "
+                f"p95<={item['p95'] * 1000:.1f}ms max={item['max'] * 1000:.1f}ms"
+            )
+        for item in snapshot['counters']:
+            lines.append(f"  {_display_name(item)}: {item['value']:g}")
+        return '\n'.join(lines)
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format"""
+        def fmt_labels(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ''
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+        lines = []
+        typed = set()
+
+        def declare(name, kind):
+            # One TYPE line per family, before its first series
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {name} {kind}')
+
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                declare(name, 'counter')
+                lines.append(f'{name}{fmt_labels(labels)} {value}')
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                declare(name, 'histogram')
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{fmt_labels(labels, [("le", bound)])} {cumulative}')
+                lines.append(f'{name}_bucket{fmt_labels(labels, [("le", "+Inf")])} {histogram.count}')
+                lines.append(f'{name}_sum{fmt_labels(labels)} {histogram.total}')
+                lines.append(f'{name}_count{fmt_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str, fmt: Optional[str] = None):
+        """Write metrics to ``path`` as JSON or a Prometheus textfile (.prom)"""
+        path = Path(path)
+        fmt = fmt or ('prometheus' if path.suffix == '.prom' else 'json')
+        if fmt == 'prometheus':
+            content = self.to_prometheus()
+        elif fmt == 'json':
+            content = json.dumps(self.snapshot(), indent=2)
+        else:
+            raise ValueError(f"Unknown metrics export format: {fmt}")
+        # Write then rename so textfile collectors never read a partial file
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_text(content)
+        tmp_path.replace(path)
+
+
+metrics = MetricsRegistry()
+
+
+def configure_metrics(config: Optional[Dict[str, Any]]) -> MetricsRegistry:
+    """Enable the global registry from the ``metrics`` section of config.yaml"""
+    metrics.enable(bool((config or {}).get('enabled', False)))
+    return metrics
+
+
+def finish_metrics(config: Optional[Dict[str, Any]], logger) -> None:
+    """Log the end-of-run summary and write the configured export, if any"""
+    if not metrics.enabled:
+        return
+    logger.info(metrics.summary())
+    export_path = (config or {}).get('export_path')
+    if export_path:
+        metrics.export(export_path, (config or {}).get('export_format'))
+        logger.info(f"Metrics written to {export_path}")
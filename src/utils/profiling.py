@@ -0,0 +1,215 @@
+import argparse
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_active: Optional['PipelineProfiler'] = None
+
+
+class _StageStats:
+    __slots__ = ('calls', 'seconds', 'peak_bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak_bytes = 0
+
+
+class PipelineProfiler:
+    """Profile a pipeline run and attribute time to named stages.
+
+    ``deterministic`` mode runs cProfile and writes ``profile.pstats``;
+    both modes run a stack sampler (every ``interval`` seconds) on the
+    profiled thread and write ``profile.collapsed``, one
+    ``stage;frame;frame count`` line per stack, for flamegraph.pl or
+    speedscope. With ``trace_memory`` tracemalloc records how far traced
+    memory rose above its level at the start of each stage. ``profile.txt`` summarizes stages and
+    the top-N functions.
+    """
+
+    def __init__(self,
+                 output_dir: str,
+                 mode: str = 'deterministic',
+                 interval: float = 0.005,
+                 trace_memory: bool = False,
+                 top_n: int = 25):
+        if mode not in ('deterministic', 'sampling'):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        if trace_memory and not hasattr(tracemalloc, 'reset_peak'):
+            raise ValueError("Per-stage memory tracking requires Python 3.9+")
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.interval = interval
+        self.trace_memory = trace_memory
+        self.top_n = top_n
+        self.stages: Dict[str, _StageStats] = {}
+        self.samples: Counter = Counter()
+        self._stage_stack: List[list] = []
+        self._thread_id = None
+        self._profile = None
+        self._sampler = None
+        self._stop = threading.Event()
+        self._started = 0.0
+        self.wall_seconds = 0.0
+
+    def __enter__(self) -> 'PipelineProfiler':
+        global _active
+        _active = self
+        self._thread_id = threading.get_ident()
+        if self.trace_memory:
+            tracemalloc.start()
+        self._sampler = threading.Thread(target=self._sample_loop, name='profiler-sampler', daemon=True)
+        self._sampler.start()
+        self._started = time.perf_counter()
+        if self.mode == 'deterministic':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        if self._profile is not None:
+            self._profile.disable()
+        self.wall_seconds = time.perf_counter() - self._started
+        self._stop.set()
+        self._sampler.join()
+        if self.trace_memory:
+            tracemalloc.stop()
+        _active = None
+        self.write_reports()
+        return False
+
+    @contextmanager
+    def stage(self, name: str):
+        """Attribute time (and peak memory) inside the block to ``name``"""
+        if threading.get_ident() != self._thread_id:
+            # Only the profiled thread's stages are tracked
+            yield
+            return
+        start_bytes = 0
+        if self.trace_memory:
+            # Fold the parent's peak so far into it before resetting
+            if self._stage_stack:
+                parent = self._stage_stack[-1]
+                parent[2] = max(parent[2], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        # [name, start time, absolute peak, traced bytes at entry]
+        frame = [name, time.perf_counter(), 0, start_bytes]
+        self._stage_stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stage_stack.pop()
+            stats = self.stages.setdefault(name, _StageStats())
+            stats.calls += 1
+            stats.seconds += time.perf_counter() - frame[1]
+            if self.trace_memory:
+                peak = max(frame[2], tracemalloc.get_traced_memory()[1])
+                # Memory held from before the stage is not the stage's
+                stats.peak_bytes = max(stats.peak_bytes, peak - frame[3])
+                if self._stage_stack:
+                    parent = self._stage_stack[-1]
+                    parent[2] = max(parent[2], peak)
+
+    def _sample_loop(self):
+        own_file = __file__
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename != own_file:
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stages = [f"stage:{entry[0]}" for entry in list(self._stage_stack)]
+            self.samples[';'.join(stages + stack[::-1])] += 1
+
+    def write_reports(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / 'profile.collapsed', 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        if self._profile is not None:
+            self._profile.dump_stats(str(self.output_dir / 'profile.pstats'))
+        (self.output_dir / 'profile.txt').write_text(self.report())
+
+    def report(self) -> str:
+        """Short text report: stages, then top-N functions"""
+        lines = [f"Profile ({self.mode}), wall time {self.wall_seconds:.3f}s, {sum(self.samples.values())} samples", ""]
+        lines.append(f"{'stage':<28}{'calls':>8}{'seconds':>12}{'% wall':>9}" +
+                     (f"{'peak MiB':>11}" if self.trace_memory else ''))
+        for name, stats in sorted(self.stages.items(), key=lambda item: -item[1].seconds):
+            share = stats.seconds / self.wall_seconds * 100 if self.wall_seconds else 0.0
+            line = f"{name:<28}{stats.calls:>8}{stats.seconds:>12.3f}{share:>8.1f}%"
+            if self.trace_memory:
+                line += f"{stats.peak_bytes / 2 ** 20:>11.1f}"
+            lines.append(line)
+        lines.append("")
+
+        if self._profile is not None:
+            buffer = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=buffer).strip_dirs()
+            stats.sort_stats('cumulative').print_stats(self.top_n)
+            stats.sort_stats('tottime').print_stats(self.top_n)
+            lines.append(buffer.getvalue())
+        else:
+            # Self time per function from the sampled stacks
+            self_counts = Counter()
+            for stack, count in self.samples.items():
+                self_counts[stack.rsplit(';', 1)[-1]] += count
+            total = sum(self_counts.values()) or 1
+            lines.append(f"Top {self.top_n} functions by sampled self time:")
+            for name, count in self_counts.most_common(self.top_n):
+                lines.append(f"{count / total * 100:>7.1f}%  {name}")
+        return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def _null_stage():
+    yield
+
+
+def profile_stage(name: str):
+    """Mark a named pipeline stage; a no-op unless a profiler is running"""
+    if _active is None:
+        return _null_stage()
+    return _active.stage(name)
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add --profile options to a script's argument parser"""
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile the run and write pstats, collapsed stacks and a report to DIR")
+    parser.add_argument("--profile-mode", choices=["deterministic", "sampling"], default="deterministic",
+                        help="cProfile plus stack sampling, or stack sampling only (lower overhead)")
+    parser.add_argument("--profile-interval", type=float, default=5.0, metavar="MS",
+                        help="stack sampling interval in milliseconds")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="track peak memory per stage with tracemalloc")
+
+
+@contextmanager
+def profiler_from_args(args: argparse.Namespace, logger: logging.Logger):
+    """Run the block under a profiler if --profile was given"""
+    if not getattr(args, "profile", None):
+        yield None
+        return
+    with PipelineProfiler(
+        args.profile,
+        mode=args.profile_mode,
+        interval=args.profile_interval / 1000,
+        trace_memory=args.trace_memory,
+    ) as profiler:
+        yield profiler
+    logger.info(f"Profile written to {args.profile}\n{profiler.report()}")
@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import pytest
+from src.database.db_manager import DatabaseManager
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Empty SQLite database with every table created"""
+    db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    db_manager.init_db()
+    return db_manager
@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+import pytest
+from src.data_ingestion.crawl_scheduler import CrawlScheduler, PRIORITY_RECRAWL, normalize_url
+from src.models import CrawlFrontierEntry, Startup, WebsiteData
+
+class FakeCrawler:
+    """Records fetches instead of hitting the network"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.fetched = Counter()
+        self._lock = threading.Lock()
+
+    def fetch_website(self, url):
+        with self._lock:
+            self.fetched[url] += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection reset")
+        return f"<html><title>{url}</title></html>"
+
+    def parse_website(self, html, url, startup_id):
+        return WebsiteData(title=url)
+
+def add_sites(db_manager, urls):
+    with db_manager.session_scope() as session:
+        for n, url in enumerate(urls, start=1):
+            session.add(Startup(submission_id=f"s{n}"))
+            session.flush()
+            CrawlScheduler.add(session, url, n)
+
+def scheduler(db_manager, crawler, **kwargs):
+    return CrawlScheduler(db_manager, crawler, crawl_delay=timedelta(0), **kwargs)
+
+def test_concurrent_schedulers_fetch_each_url_once(db_manager):
+    urls = [f"https://site{d}.example/page{p}" for d in range(4) for p in range(3)]
+    add_sites(db_manager, urls)
+    crawler = FakeCrawler(delay=0.02)
+    errors = []
+
+    def run():
+        try:
+            scheduler(db_manager, crawler, batch_size=2).run(stop_when_idle=True)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(crawler.fetched) == sorted(urls)
+    assert set(crawler.fetched.values()) == {1}
+    with db_manager.session_scope() as session:
+        assert session.query(WebsiteData).count() == len(urls)
+        assert session.query(CrawlFrontierEntry).filter(CrawlFrontierEntry.claim_token.isnot(None)).count() == 0
+
+def test_url_variants_share_one_entry(db_manager):
+    add_sites(db_manager, ["https://www.acme.com", "acme.com", "http://acme.com/", "https://ACME.com:443/"])
+    with db_manager.session_scope() as session:
+        entry = session.query(CrawlFrontierEntry).one()
+        assert entry.url == "https://acme.com/"
+        assert entry.startup_ids == [1, 2, 3, 4]
+    assert normalize_url("http://127.0.0.1:8080/sites/a/") == "http://127.0.0.1:8080/sites/a"
+
+def test_batch_takes_one_entry_per_domain(db_manager):
+    add_sites(db_manager, [f"https://hot.example/{n}" for n in range(10)] + ["https://quiet.example/"])
+    claimed = scheduler(db_manager, FakeCrawler()).claim(limit=5)
+    assert sorted(entry.domain for entry in claimed) == ["hot.example", "quiet.example"]
+    # The leased domains are skipped until the batch is done
+    assert scheduler(db_manager, FakeCrawler()).claim(limit=5) == []
+
+def test_recrawls_ordered_by_score_and_staleness(db_manager):
+    add_sites(db_manager, ["https://low.example/", "https://high.example/",
+                           "https://stale.example/", "https://new.example/"])
+    now = datetime.utcnow()
+    with db_manager.session_scope() as session:
+        for entry in session.query(CrawlFrontierEntry):
+            if entry.domain != "new.example":
+                entry.priority = PRIORITY_RECRAWL
+                entry.last_crawled_at = now - timedelta(days=8)
+                entry.next_due_at = now - timedelta(days=1)
+            if entry.domain == "stale.example":
+                entry.next_due_at = now - timedelta(days=20)
+    crawl = scheduler(db_manager, FakeCrawler())
+    crawl.rescore({2: 1.0})
+
+    order = [entry.domain for entry in crawl.claim(limit=4)]
+    assert order == ["new.example", "stale.example", "high.example", "low.example"]
+
+    # The score boost outlives the crawl
+    crawl.run(stop_when_idle=True)
+    with db_manager.session_scope() as session:
+        entry = session.query(CrawlFrontierEntry).filter_by(domain="high.example").one()
+        assert entry.score == 1.0 and entry.priority == PRIORITY_RECRAWL
+
+def test_crawl_errors_back_off_instead_of_stopping(db_manager):
+    add_sites(db_manager, ["https://down.example/", "https://other.example/"])
+    crawler = FakeCrawler(fail=True)
+    assert scheduler(db_manager, crawler).run(stop_when_idle=True) == 2
+    with db_manager.session_scope() as session:
+        entries = session.query(CrawlFrontierEntry).all()
+        assert [entry.error_count for entry in entries] == [1, 1]
+        assert all(entry.next_due_at > datetime.utcnow() for entry in entries)
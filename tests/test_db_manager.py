@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import pytest
+from src.database.db_manager import Base, DatabaseManager, TimedQueuePool
+from src.models import Startup
+
+@pytest.fixture
+def replicated(tmp_path):
+    """Manager whose read replica is a separate SQLite file"""
+    db_manager = DatabaseManager.from_config({
+        'connection_string': f"sqlite:///{tmp_path / 'primary.db'}",
+        'read_replica_connection_string': f"sqlite:///{tmp_path / 'replica.db'}",
+    })
+    db_manager.init_db()
+    Base.metadata.create_all(db_manager.read_engine)
+    return db_manager
+
+def test_from_config_ignores_pool_sizing_for_sqlite(tmp_path):
+    db_manager = DatabaseManager.from_config({
+        'connection_string': f"sqlite:///{tmp_path / 'test.db'}",
+        'pool': {'size': 20, 'max_overflow': 0},
+        'statement_timeout_ms': 5000,
+    })
+    assert db_manager.read_engine is db_manager.engine
+    assert not isinstance(db_manager.engine.pool, TimedQueuePool)
+    assert db_manager.check_connection()
+
+    status = db_manager.get_pool_status()
+    assert list(status) == ['primary']
+    assert 'status' in status['primary']
+
+def test_pool_status_reports_replica(replicated):
+    assert list(replicated.get_pool_status()) == ['primary', 'replica']
+
+def test_read_only_scope_reads_replica_and_rolls_back(replicated):
+    with replicated.session_scope() as session:
+        session.add(Startup(submission_id="primary"))
+
+    with replicated.session_scope(read_only=True) as session:
+        assert session.query(Startup).count() == 0
+        session.add(Startup(submission_id="discarded"))
+        session.flush()
+
+    with replicated.session_scope(read_only=True) as session:
+        assert session.query(Startup).count() == 0
+    with replicated.session_scope() as session:
+        assert [s.submission_id for s in session.query(Startup)] == ["primary"]
+
+def add_startups(db_manager, count):
+    with db_manager.session_scope() as session:
+        start = session.query(Startup).count()
+        session.add_all([Startup(submission_id=f"s{i}") for i in range(start, start + count)])
+
+def test_table_stats_counts_every_table(db_manager):
+    add_startups(db_manager, 3)
+    stats = db_manager.get_table_stats()
+    assert set(stats) == set(Base.metadata.tables)
+    assert stats['startups'] == 3
+    assert stats['linkedin_profiles'] == 0
+
+def test_approximate_counts_use_sqlite_stat1_after_analyze(db_manager):
+    add_startups(db_manager, 3)
+    # No statistics yet: falls back to exact counts
+    assert db_manager.get_table_stats(approximate=True) == db_manager.get_table_stats()
+
+    with db_manager.engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    add_startups(db_manager, 2)
+    approximate = db_manager.get_table_stats(approximate=True)
+    assert approximate['startups'] == 3
+    assert db_manager.get_table_stats()['startups'] == 5
+
+def test_storage_stats_report_every_table(db_manager):
+    add_startups(db_manager, 3)
+    with db_manager.engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    stats = db_manager.get_storage_stats()
+    assert set(stats) == set(Base.metadata.tables)
+    for table_stats in stats.values():
+        assert set(table_stats) == {'rows', 'table_bytes', 'toast_bytes', 'index_bytes', 'total_bytes'}
+        assert table_stats['toast_bytes'] is None
+    assert stats['startups']['rows'] == 3
+    if stats['startups']['table_bytes'] is not None:
+        assert stats['startups']['total_bytes'] >= stats['startups']['table_bytes'] > 0
@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import pytest
+from src.database.job_queue import JobQueue, JobWorker, DONE, DEAD
+from src.models import Startup, EnrichmentJob
+
+@pytest.fixture
+def queue(db_manager):
+    with db_manager.session_scope() as session:
+        session.add_all([Startup(submission_id=f"s{i}") for i in range(3)])
+    return JobQueue(db_manager, retry_base_seconds=0)
+
+def test_enqueue_is_idempotent(queue):
+    with queue.db_manager.session_scope() as session:
+        assert queue.enqueue(session, "crawl-website", 1)
+        session.flush()
+        assert not queue.enqueue(session, "crawl-website", 1)
+    assert queue.counts() == {"pending": 1}
+
+def test_claim_leases_each_job_once(queue):
+    with queue.db_manager.session_scope() as session:
+        for startup_id in (1, 2, 3):
+            queue.enqueue(session, "crawl-website", startup_id)
+    first = queue.claim("worker-a", limit=2)
+    second = queue.claim("worker-b", limit=2)
+    assert len(first) == 2 and len(second) == 1
+    assert {job.id for job in first}.isdisjoint(job.id for job in second)
+    assert queue.claim("worker-c") == []
+
+def test_failures_retry_then_dead_letter(queue):
+    with queue.db_manager.session_scope() as session:
+        queue.enqueue(session, "crawl-website", 1, max_attempts=3)
+    calls = []
+
+    def flaky(job):
+        calls.append(job.attempts)
+        raise RuntimeError("boom")
+
+    JobWorker(queue, {"crawl-website": flaky}).run(stop_when_idle=True)
+    assert calls == [1, 2, 3]
+    with queue.db_manager.session_scope() as session:
+        job = session.query(EnrichmentJob).one()
+        assert job.status == DEAD
+        assert "boom" in job.last_error
+    assert queue.requeue_dead() == 1
+
+def test_handler_writes_commit_with_completion(queue):
+    with queue.db_manager.session_scope() as session:
+        queue.enqueue(session, "score", 2)
+
+    def handler(job):
+        def store(session):
+            session.get(Startup, job.startup_id).company_name = "Scored"
+        return store
+
+    JobWorker(queue, {"score": handler}).run(stop_when_idle=True)
+    with queue.db_manager.session_scope() as session:
+        assert session.get(Startup, 2).company_name == "Scored"
+        assert session.query(EnrichmentJob).one().status == DONE
+
+def test_handler_runs_before_the_transaction_opens(queue):
+    with queue.db_manager.session_scope() as session:
+        queue.enqueue(session, "fetch", 1)
+    pool = queue.db_manager.engine.pool
+    checked_out = []
+
+    def handler(job):
+        checked_out.append(pool.checkedout())
+
+    JobWorker(queue, {"fetch": handler}).run(stop_when_idle=True)
+    assert checked_out == [0]
+    assert queue.counts() == {"done": 1}
@@ -0,0 +1,104 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import json
+import logging
+import multiprocessing
+import pytest
+from src.utils import logger as logger_module
+from src.utils.logger import DEFAULT_LOGGING_CONFIG, log_context, setup_logger, shutdown_logging
+
+@pytest.fixture
+def log_output(capsys, monkeypatch):
+    """Restart the listener on captured stderr; call the result to read it"""
+    def configure(**config):
+        shutdown_logging()
+        config = {**DEFAULT_LOGGING_CONFIG, "format": "%(name)s - %(message)s", **config}
+        monkeypatch.setattr(logger_module, "load_logging_config", lambda: config)
+
+    def read() -> str:
+        shutdown_logging()
+        return capsys.readouterr().err
+
+    configure()
+    read.configure = configure
+    yield read
+    shutdown_logging()
+
+def test_records_are_written_once(log_output):
+    module_logger = logging.getLogger("tests.once")
+    logger = setup_logger("tests.once")
+    setup_logger("tests.once")
+    module_logger.info("from module logger")
+    logger.info("from setup logger")
+    logging.getLogger("tests.other").warning("unconfigured")
+
+    lines = log_output().splitlines()
+    assert lines == [
+        "tests.once - from module logger",
+        "tests.once - from setup logger",
+        "tests.other - unconfigured",
+    ]
+
+def test_context_fields_are_appended(log_output):
+    logger = setup_logger("tests.context")
+    with log_context(submission_id="s1"):
+        with log_context(stage="crawl"):
+            logger.info("fetched")
+        logger.info("stored")
+    logger.info("done")
+
+    assert log_output().splitlines() == [
+        "tests.context - fetched [submission_id=s1 stage=crawl]",
+        "tests.context - stored [submission_id=s1]",
+        "tests.context - done",
+    ]
+
+def test_traceback_follows_context_in_text(log_output):
+    logger = setup_logger("tests.text")
+    with log_context(stage="enrich"):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+    output = log_output()
+    assert output.startswith("tests.text - failed [stage=enrich]\nTraceback")
+    assert output.rstrip().endswith("ValueError: boom")
+
+def test_traceback_is_a_json_field(log_output):
+    log_output.configure(json=True)
+    logger = setup_logger("tests.json")
+    with log_context(stage="enrich"):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+    entry = json.loads(log_output())
+    assert entry["message"] == "failed"
+    assert entry["stage"] == "enrich"
+    assert entry["exception"].startswith("Traceback")
+    assert "ValueError: boom" in entry["exception"]
+
+def log_from_child():
+    setup_logger("tests.child").info("from child")
+    shutdown_logging()
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_forked_child_restarts_listener(log_output, tmp_path):
+    log_file = tmp_path / "app.log"
+    log_output.configure(file=str(log_file))
+    setup_logger("tests.parent").info("from parent")
+
+    child = multiprocessing.get_context("fork").Process(target=log_from_child)
+    child.start()
+    child.join()
+    log_output()
+
+    assert child.exitcode == 0
+    assert sorted(log_file.read_text().splitlines()) == ["tests.child - from child", "tests.parent - from parent"]
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import json
+import zlib
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import sqlite
+from scripts.migrate_raw_data import migrate_raw_data
+from src.database.db_manager import DatabaseManager
+from src.database.types import CompressedJSON
+from src.models import LinkedInProfile
+
+# linkedin_profiles as created before raw_data was compressed
+LEGACY_TABLE = """
+CREATE TABLE linkedin_profiles (
+    id INTEGER PRIMARY KEY, startup_id INTEGER, created_at DATETIME, updated_at DATETIME,
+    full_name VARCHAR, headline VARCHAR, summary VARCHAR, country VARCHAR, city VARCHAR,
+    experiences JSON, education JSON, skills JSON, accomplishments JSON,
+    connections_count INTEGER, raw_data JSON
+)
+"""
+
+@pytest.mark.parametrize("stored", [
+    {"skills": ["python"]},
+    '{"skills": ["python"]}',
+    b'{"skills": ["python"]}',
+    zlib.compress(b'{"skills": ["python"]}'),
+])
+def test_compressed_json_reads_legacy_values(stored):
+    assert CompressedJSON().process_result_value(stored, sqlite.dialect()) == {"skills": ["python"]}
+
+def test_migration_compresses_and_folds_legacy_columns(tmp_path):
+    db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with db_manager.engine.begin() as conn:
+        conn.execute(text(LEGACY_TABLE))
+        conn.execute(text(
+            "INSERT INTO linkedin_profiles (id, full_name, raw_data, experiences, education) "
+            "VALUES (1, 'Full', :full, :experiences, NULL), (2, 'Partial', :partial, NULL, :education)"
+        ), {
+            "full": json.dumps({"experiences": [{"title": "CEO"}]}),
+            "experiences": json.dumps([{"title": "stale copy"}]),
+            "partial": json.dumps({"full_name": "Partial"}),
+            "education": json.dumps([{"school": "USF"}]),
+        })
+
+    assert migrate_raw_data(db_manager, batch_size=1) == 2
+    columns = {c["name"] for c in inspect(db_manager.engine).get_columns("linkedin_profiles")}
+    assert not columns & {"experiences", "education", "accomplishments"}
+
+    with db_manager.engine.connect() as conn:
+        stored = conn.execute(text("SELECT raw_data FROM linkedin_profiles")).scalars().all()
+    assert all(value[:1] == b"\x78" for value in stored)
+
+    with db_manager.session_scope() as session:
+        full, partial = session.query(LinkedInProfile).order_by(LinkedInProfile.id).all()
+        assert full.experiences == [{"title": "CEO"}]
+        assert partial.education == [{"school": "USF"}]
+
+    # Already migrated: nothing left to do
+    assert migrate_raw_data(db_manager) == 0
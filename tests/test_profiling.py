@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.profiling import PipelineProfiler, profile_stage
+
+MIB = 2 ** 20
+
+def test_stage_peak_excludes_memory_held_before_it(tmp_path):
+    with PipelineProfiler(str(tmp_path), mode="sampling", trace_memory=True) as profiler:
+        held = bytearray(8 * MIB)
+        with profile_stage("outer"):
+            with profile_stage("inner"):
+                temporary = bytearray(2 * MIB)
+                del temporary
+            temporary = bytearray(4 * MIB)
+            del temporary
+        del held
+
+    inner = profiler.stages["inner"].peak_bytes
+    outer = profiler.stages["outer"].peak_bytes
+    assert 2 * MIB <= inner < 3 * MIB
+    assert 4 * MIB <= outer < 5 * MIB
+    assert (tmp_path / "profile.txt").exists()
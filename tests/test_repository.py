@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import pytest
+from sqlalchemy import event
+from src.database.repository import StartupRepository
+from src.models import Startup, LinkedInProfile, WebsiteData
+
+@pytest.fixture
+def db_manager(db_manager):
+    with db_manager.session_scope() as session:
+        for i in range(5):
+            startup = Startup(submission_id=f"s{i}", raw_typeform_data={"answers": []})
+            startup.linkedin_profile = LinkedInProfile(
+                full_name=f"Founder {i}",
+                raw_data={"experiences": [{"title": "CEO"}], "education": [{"school": "USF"}]},
+            )
+            startup.website_data = WebsiteData(title=f"Startup {i}", raw_html="<html></html>")
+            session.add(startup)
+    return db_manager
+
+@pytest.fixture
+def statements(db_manager):
+    executed = []
+    event.listen(db_manager.engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+def test_list_dossiers_uses_constant_queries(db_manager, statements):
+    with db_manager.session_scope() as session:
+        dossiers = StartupRepository(session).list_dossiers()
+        names = [startup.linkedin_profile.full_name for startup in dossiers]
+        titles = [startup.website_data.title for startup in dossiers]
+    assert len(names) == len(titles) == 5
+    assert len(statements) == 3
+    assert all("raw_data" not in statement for statement in statements)
+
+def test_profile_details_load_without_lazy_loads(db_manager, statements):
+    with db_manager.session_scope() as session:
+        dossiers = StartupRepository(session).list_dossiers(include_profile_details=True)
+        history = [(startup.linkedin_profile.experiences, startup.linkedin_profile.education)
+                   for startup in dossiers]
+    assert history == [([{"title": "CEO"}], [{"school": "USF"}])] * 5
+    assert len(statements) == 3
+    assert not any("raw_html" in statement or "raw_typeform_data" in statement for statement in statements)
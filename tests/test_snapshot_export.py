@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import json
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+from src.database.snapshot_export import SnapshotExporter
+from src.models import Startup, WebsiteData
+
+@pytest.fixture
+def db_manager(db_manager):
+    with db_manager.session_scope() as session:
+        session.add_all([Startup(submission_id=f"s{i}", company_name=f"Startup {i}") for i in range(3)])
+    return db_manager
+
+def exported_ids(output_dir: Path, table: str = "startups") -> list:
+    manifest = json.loads((output_dir / "_manifest.json").read_text())
+    ids = []
+    for name in manifest[table]["files"]:
+        ids.extend(np.load(output_dir / name)["id"].tolist())
+    return ids
+
+def test_incremental_export_writes_only_changed_rows(db_manager, tmp_path):
+    output_dir = tmp_path / "out"
+    exporter = SnapshotExporter(db_manager, output_dir, fmt="npz")
+    assert exporter.export(["startups"]) == {"startups": 3}
+    assert exporter.export(["startups"]) == {"startups": 0}
+
+    with db_manager.session_scope() as session:
+        session.get(Startup, 2).company_name = "Renamed"
+    assert exporter.export(["startups"]) == {"startups": 1}
+    assert exported_ids(output_dir) == [1, 2, 3, 2]
+
+def test_late_commit_below_watermark_is_exported(db_manager, tmp_path):
+    output_dir = tmp_path / "out"
+    exporter = SnapshotExporter(db_manager, output_dir, fmt="npz")
+    exporter.export(["startups"])
+    manifest = json.loads((output_dir / "_manifest.json").read_text())
+    watermark = datetime.fromisoformat(manifest["startups"]["watermark"])
+
+    # Timestamped before the previous export read, committed after it
+    with db_manager.session_scope() as session:
+        session.add(Startup(submission_id="late", updated_at=watermark - timedelta(seconds=30)))
+    assert exporter.export(["startups"]) == {"startups": 1}
+    assert exported_ids(output_dir) == [1, 2, 3, 4]
+
+def test_full_export_replaces_partitions(db_manager, tmp_path):
+    output_dir = tmp_path / "out"
+    exporter = SnapshotExporter(db_manager, output_dir, fmt="npz", chunk_size=2)
+    exporter.export(["startups"])
+    old_files = sorted((output_dir / "startups").iterdir())
+    assert exporter.export(["startups"], incremental=False) == {"startups": 3}
+    assert not any(path.exists() for path in old_files)
+    assert exported_ids(output_dir) == [1, 2, 3]
+
+def test_partitions_share_one_schema(db_manager, tmp_path):
+    ds = pytest.importorskip("pyarrow.dataset")
+    from src.database.snapshot_export import arrow_schema_for
+
+    with db_manager.session_scope() as session:
+        session.add_all([
+            WebsiteData(startup_id=1, social_links={"github": 42}),
+            WebsiteData(startup_id=2, social_links={"github": "acme", "x": "@acme"}),
+            WebsiteData(startup_id=3),
+        ])
+    output_dir = tmp_path / "out"
+    SnapshotExporter(db_manager, output_dir, fmt="arrow", chunk_size=1).export(["website_data"])
+
+    manifest = json.loads((output_dir / "_manifest.json").read_text())["website_data"]
+    schema = arrow_schema_for(manifest["columns"])
+    assert not {"contact_info", "social_links", "og_tags"} & set(manifest["columns"])
+    files = [str(output_dir / name) for name in manifest["files"]]
+    assert len(files) == 3
+    # Keys first seen in a later partition are appended to the schema
+    for path in files:
+        file_schema = ds.dataset(path, format="ipc").schema
+        assert list(file_schema) == list(schema)[:len(file_schema)]
+    assert "social_links.x" not in ds.dataset(files[0], format="ipc").schema.names
+    table = ds.dataset(files, format="ipc", schema=schema).to_table()
+    assert table.column("social_links.github").to_pylist() == ["42", "acme", None]
+    assert table.column("social_links.x").to_pylist() == [None, "@acme", None]
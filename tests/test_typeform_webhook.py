@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import pytest
+from src.data_ingestion.typeform_connector import TypeFormConnector
+from src.data_ingestion.typeform_webhook import TypeformWebhookServer, verify_signature, webhook_to_response
+from src.models import Startup
+
+SECRET = "webhook-secret"
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).digest()
+    return "sha256=" + base64.b64encode(digest).decode("ascii")
+
+def submission(token: str) -> dict:
+    return {"token": token, "answers": [], "submitted_at": "2024-01-01T00:00:00Z"}
+
+@pytest.fixture
+def server(db_manager):
+    return TypeformWebhookServer(db_manager, TypeFormConnector("test"), SECRET, batch_window=0.05)
+
+def stored_ids(server):
+    with server.db_manager.session_scope() as session:
+        return sorted(startup.submission_id for startup in session.query(Startup))
+
+def test_verify_signature():
+    body = b'{"event_type": "form_response"}'
+    assert verify_signature(SECRET, body, sign(body))
+    assert not verify_signature(SECRET, body, sign(body, "other-secret"))
+    assert not verify_signature(SECRET, body + b" ", sign(body))
+    assert not verify_signature(SECRET, body, sign(body)[len("sha256="):])
+    assert not verify_signature(SECRET, body, None)
+
+def test_webhook_to_response_uses_token_as_response_id():
+    response = webhook_to_response({"event_type": "form_response", "form_response": submission("tok-1")})
+    assert response["response_id"] == "tok-1"
+    assert response["answers"] == []
+
+def test_failed_batch_falls_back_to_single_writes(server):
+    good = webhook_to_response({"form_response": submission("good")})
+    bad = {"response_id": "bad"}  # no answers: processing raises
+    errors = server._store_batch([good, bad])
+    assert errors[0] is None
+    assert isinstance(errors[1], KeyError)
+    assert stored_ids(server) == ["good"]
+
+def test_requests_are_acknowledged_after_commit(server):
+    async def post(body: bytes, signature: str) -> int:
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(
+            f"POST /webhooks/typeform HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            f"Typeform-Signature: {signature}\r\n\r\n".encode("ascii") + body
+        )
+        status = int((await reader.readline()).split()[1])
+        writer.close()
+        return status
+
+    async def scenario():
+        await server.start("127.0.0.1", 0)
+        bodies = [json.dumps({"event_type": "form_response", "form_response": submission(f"t{i}")}).encode()
+                  for i in range(3)]
+        statuses = await asyncio.gather(*(post(body, sign(body)) for body in bodies))
+        rejected = await post(bodies[0], sign(bodies[0], "other-secret"))
+        await server.stop()
+        return statuses, rejected
+
+    statuses, rejected = asyncio.run(scenario())
+    assert statuses == [200, 200, 200]
+    assert rejected == 401
+    assert stored_ids(server) == ["t0", "t1", "t2"]